@@ -109,6 +109,7 @@ Examples:
     parser.add_argument("--description", help="Repository description (for project mode)")
     parser.add_argument("--private", action="store_true", help="Make repository private (for project mode)")
     parser.add_argument("--public", action="store_true", help="Make repository public (for project mode)")
+    parser.add_argument("--force-create", action="store_true", help="Create the repository without checking for an existing one first (for project mode)")
     
     # Batch mode arguments
     parser.add_argument("--files", help="Comma-separated list of files to upload (for batch mode)")
@@ -1,4 +1,5 @@
 import os
+import functools
 import yaml
 import getpass
 import json
@@ -59,6 +60,9 @@ DEFAULT_CONFIG = {
 # Global cache for the session key so we don't ask for password on every single read
 _SESSION_KEY = None
 
+# (path, mtime_ns, size) -> decrypted config of the last profile loaded
+_CONFIG_CACHE = None
+
 def derive_key(password, salt):
     """Derives a strong key from a password using PBKDF2."""
     if not HAS_CRYPTO: return None
@@ -130,7 +134,9 @@ def validate_config_path(config_path):
         raise ValueError("Security Alert: Unauthorized configuration path.")
     return True
 
+@functools.lru_cache(maxsize=1)
 def get_active_profile_path():
+    # Cached: the active profile only changes through set_active_profile
     config_dir = get_config_dir()
     settings_path = os.path.join(config_dir, "settings.json")
     active_profile = "default"
@@ -153,9 +159,11 @@ def set_active_profile(profile_name):
     try:
         with open(settings_path, 'w') as f:
             json.dump({"active_profile": profile_name}, f)
+        get_active_profile_path.cache_clear()
         # Clear session key on switch to force re-auth for new profile
-        global _SESSION_KEY
+        global _SESSION_KEY, _CONFIG_CACHE
         _SESSION_KEY = None
+        _CONFIG_CACHE = None
         os.environ.pop("PYGITUP_PASSWORD", None)
         return True, f"Switched to profile: {profile_name}"
     except Exception as e: return False, str(e)
@@ -165,8 +173,16 @@ def list_profiles():
     if not os.path.exists(profiles_dir): return []
     return [f.replace(".yaml", "") for f in os.listdir(profiles_dir) if f.endswith(".yaml")]
 
+def _config_cache_key(config_path):
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return None
+    return (config_path, st.st_mtime_ns, st.st_size)
+
 def load_config(config_path=None):
     """Load configuration from the active profile."""
+    global _CONFIG_CACHE
     config = copy.deepcopy(DEFAULT_CONFIG)
     if config_path is None:
         config_path = get_active_profile_path()
@@ -176,6 +192,12 @@ def load_config(config_path=None):
             print_error(str(e))
             return config
 
+    # Profiles are re-read on every feature launch; skip the YAML parse and
+    # decryption while the file is unchanged. Callers get their own copy.
+    cache_key = _config_cache_key(config_path)
+    if cache_key and _CONFIG_CACHE and _CONFIG_CACHE[0] == cache_key:
+        return copy.deepcopy(_CONFIG_CACHE[1])
+
     if os.path.exists(config_path):
         try:
             with open(config_path, 'r') as f:
@@ -199,6 +221,8 @@ def load_config(config_path=None):
                         config["github"]["anthropic_api_key"] = decrypt_data(config["github"].get("anthropic_api_key"), salt)
                         # Ollama base URL is not sensitive usually, but we could encrypt it too
                         config["github"]["ollama_base_url"] = decrypt_data(config["github"].get("ollama_base_url"), salt) or config["github"].get("ollama_base_url", "")
+            if cache_key:
+                _CONFIG_CACHE = (cache_key, copy.deepcopy(config))
         except Exception as e: 
             print_warning(f"Could not load config: {e}")
     return config
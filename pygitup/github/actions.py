@@ -1,12 +1,11 @@
 import questionary
 import os
 import subprocess
-import requests
 import time
 import zipfile
 import io
-from .api import github_request, toggle_workflow_api, get_repo_contents, get_workflow_run_logs
-from ..utils.ui import print_success, print_error, print_info, print_header, print_warning, console, Panel
+from .api import github_request, toggle_workflow_api, get_repo_contents, get_workflow_run_logs, get_session
+from ..utils.ui import print_success, print_error, print_info, print_header, print_warning, console, Panel, clear_screen
 from ..utils.ai import generate_ai_workflow, analyze_failed_log
 
 PYTHON_WORKFLOW = """name: Python CI
@@ -79,16 +78,18 @@ def setup_cicd_workflow(github_username, github_token, repo_name, config):
             if repo_resp.status_code == 200:
                 contents_list = repo_resp.json()
                 file_paths = [item['path'] for item in contents_list]
+                session = get_session()
                 
                 # Context Gathering
-                code_context = ""
+                code_parts = []
                 priority_files = ["main.py", "setup.py", "requirements.txt", "package.json", "Dockerfile"]
                 for item in contents_list:
                     if item['name'] in priority_files and item['type'] == 'file':
-                        f_resp = requests.get(item['download_url'])
+                        f_resp = session.get(item['download_url'], timeout=30)
                         if f_resp.status_code == 200:
                             snippet = "\n".join(f_resp.text.splitlines()[:150])
-                            code_context += f"\n--- {item['name']} ---\n{snippet}\n"
+                            code_parts.append(f"\n--- {item['name']} ---\n{snippet}\n")
+                code_context = "".join(code_parts)
 
                 content = generate_ai_workflow(ai_key, repo_name, "\n".join(file_paths), code_context)
             
@@ -145,9 +146,7 @@ def monitor_live_build(github_username, repo_name, github_token, config):
             
             icon = "⏳" if status != "completed" else "🟢" if conclusion == "success" else "🔴"
             
-            # Use os.system directly for cleaner refresh
-            import os
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             print_header(f"Live Monitor: {repo_name}")
             print(f"\n[bold]Current Run:[/bold] {run['name']}")
             print(f"ID: {run['id']} | Branch: {run['head_branch']}")
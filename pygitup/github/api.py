@@ -1,12 +1,28 @@
 import requests
 import base64
+import concurrent.futures
+import threading
 import time
 import json
 import os
+import hashlib
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, Any, List, Union
 from dataclasses import dataclass
 from collections import defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    # SIMD-accelerated drop-in for the stdlib encoder; noticeable on large uploads
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+try:
+    # Parses straight from bytes and is several times faster on large payloads
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Rate limit tracking
 _rate_limit_cache: Dict[str, Dict] = {}
@@ -172,8 +188,84 @@ def handle_rate_limit(response: requests.Response, token: str) -> Tuple[bool, in
     return False, 0
 
 
-def github_request(method, url, token, paginate=False, **kwargs):
+MAX_RATE_LIMIT_RETRIES = 5
+
+class RateLimitedHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter that honours GitHub's primary and secondary rate limits.
+
+    On a throttled 403/429 the calling thread sleeps for Retry-After (or until
+    X-RateLimit-Reset) and the request is resent, up to MAX_RATE_LIMIT_RETRIES
+    times. The wait is shared per token, so parallel workers using the same
+    token back off together instead of re-triggering the limit.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._blocked_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _wait_for_user(self, token: str) -> None:
+        with self._lock:
+            delay = self._blocked_until.get(token, 0) - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def send(self, request, **kwargs):
+        # "token <tok>" / "Bearer <tok>"; the same key the other per-token caches use
+        token = request.headers.get("Authorization", "").split(" ", 1)[-1]
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self._wait_for_user(token)
+            response = super().send(request, **kwargs)
+
+            should_retry, sleep_duration = handle_rate_limit(response, token)
+            if not should_retry or attempt == MAX_RATE_LIMIT_RETRIES:
+                return response
+
+            sleep_duration = min(sleep_duration, 300)  # Cap at 5 minutes
+            with self._lock:
+                self._blocked_until[token] = max(self._blocked_until.get(token, 0), time.time() + sleep_duration)
+            from ..utils.ui import print_info
+            print_info(f"⏳ Rate limited. Waiting {sleep_duration:.0f} seconds...")
+            response.close()
+        return response
+
+# Transient 5xx responses are retried with exponential backoff (0.5s, 1s, 2s, ...).
+# 403/429 stay with RateLimitedHTTPAdapter, connection errors with github_request,
+# and POST is excluded because a resent create can duplicate issues or releases.
+SERVER_ERROR_RETRY = Retry(
+    total=5,
+    connect=0,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=frozenset(["GET", "PUT", "PATCH", "DELETE"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # Keep-alive pool sized for the parallel upload workers. Only the API gets the
+    # rate-limit and 5xx retries; a 429 from github.com or a connectivity probe
+    # must not park a pool thread for minutes.
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    session.mount("https://api.github.com/", RateLimitedHTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=SERVER_ERROR_RETRY))
+    return session
+
+# Shared by every GitHub API call so TCP+TLS connections are reused
+_session = _build_session()
+
+def get_session() -> requests.Session:
+    """Return the pooled session used for GitHub API calls."""
+    return _session
+
+def decode_json(response):
+    """Decode a response body, using orjson when it is installed."""
+    return _json_loads(response.content)
+
+def github_request(method, url, token, paginate=False, session=None, **kwargs):
     """Centralized GitHub API request handler with enhanced rate-limiting and abuse detection."""
+    session = session or _session
     headers = get_github_headers(token)
     if 'headers' in kwargs:
         headers.update(kwargs.pop('headers'))
@@ -196,16 +288,8 @@ def github_request(method, url, token, paginate=False, **kwargs):
                         print_warning("⏸️ Pausing due to high request rate...")
                         time.sleep(5)
                     
-                    response = requests.request(method, current_url, headers=headers, timeout=30, **kwargs)
-
-                    # Handle rate limiting
-                    should_retry, sleep_duration = handle_rate_limit(response, token)
-                    
-                    if should_retry:
-                        from ..utils.ui import print_info
-                        print_info(f"⏳ Rate limited. Waiting {sleep_duration:.0f} seconds...")
-                        time.sleep(min(sleep_duration, 300))  # Cap at 5 minutes
-                        continue
+                    # Rate-limit waits and resends happen in RateLimitedHTTPAdapter
+                    response = session.request(method, current_url, headers=headers, timeout=30, **kwargs)
 
                     # Track rate limit info from response headers
                     if 'X-RateLimit-Remaining' in response.headers:
@@ -244,7 +328,7 @@ def github_request(method, url, token, paginate=False, **kwargs):
                 return response
 
             # Pagination logic
-            data = response.json()
+            data = decode_json(response)
             if isinstance(data, list):
                 results.extend(data)
             else:
@@ -277,12 +361,36 @@ def graphql_request(query, variables, token):
     payload = {"query": query, "variables": variables}
     return github_request("POST", url, token, json=payload)
 
+def conditional_get(url, token):
+    """
+    GET with If-None-Match so unchanged resources come back as a cheap 304.
+
+    On 304 the cached payload is replayed as a 200 response, so callers
+    never have to know the body came from the local ETag cache.
+    """
+    from ..utils import etag_cache
+    cached = etag_cache.get_cached(url, token)
+    headers = {"If-None-Match": cached["etag"]} if cached else {}
+    response = github_request("GET", url, token, headers=headers)
+
+    if response.status_code == 304 and cached:
+        return PaginatedResponse(cached["data"], 200, response.headers)
+    if response.status_code == 200:
+        try:
+            data = etag_cache.compact(decode_json(response))
+        except ValueError:
+            return response
+        etag_cache.store(url, token, response.headers.get("ETag"), data)
+        # Hand back the parsed body so callers do not decode it a second time
+        return PaginatedResponse(data, 200, response.headers)
+    return response
+
 def get_repo_info(username, repo_name, token):
     """Get repository information."""
     url = f"https://api.github.com/repos/{username}/{repo_name}"
-    return github_request("GET", url, token)
+    return conditional_get(url, token)
 
-def create_repo(username, repo_name, token, description="", private=False):
+def create_repo(username, repo_name, token, description="", private=False, session=None):
     """Create a new GitHub repository."""
     url = "https://api.github.com/user/repos"
     data = {
@@ -290,20 +398,92 @@ def create_repo(username, repo_name, token, description="", private=False):
         "description": description,
         "private": private
     }
-    return github_request("POST", url, token, json=data)
+    return github_request("POST", url, token, session=session, json=data)
 
 def get_file_info(username, repo_name, file_path, token):
     """Get information about a file in a repository."""
     url = f"https://api.github.com/repos/{username}/{repo_name}/contents/{file_path}"
-    return github_request("GET", url, token)
+    return conditional_get(url, token)
+
+def blob_oid(content):
+    """Compute the git blob SHA-1 for content, matching the `sha` GitHub reports for files."""
+    h = hashlib.sha1()
+    h.update(f"blob {len(content)}\0".encode())
+    h.update(content)
+    return h.hexdigest()
 
-def update_file(username, repo_name, file_path, content, token, message, sha=None):
-    """Update or create a file in a repository."""
+def update_file(username, repo_name, file_path, content, token, message, sha=None, session=None):
+    """Update or create a file in a repository. content may be any bytes-like object."""
     url = f"https://api.github.com/repos/{username}/{repo_name}/contents/{file_path}"
-    encoded_content = base64.b64encode(content).decode('utf-8')
+    encoded_content = _b64.b64encode(content).decode('utf-8')
     data = {"message": message, "content": encoded_content}
     if sha: data["sha"] = sha
-    return github_request("PUT", url, token, json=data)
+    return github_request("PUT", url, token, session=session, json=data)
+
+# Matches the pooled session's pool_maxsize and stays well inside GitHub's abuse limits
+MAX_PARALLEL_UPLOADS = 8
+
+def _create_blob(username, repo_name, content, token, session=None):
+    """Upload raw bytes as a git blob and return the response."""
+    url = f"https://api.github.com/repos/{username}/{repo_name}/git/blobs"
+    data = {"content": _b64.b64encode(content).decode('utf-8'), "encoding": "base64"}
+    return github_request("POST", url, token, session=session, json=data)
+
+def commit_files_atomically(username, repo_name, token, files, message, branch="main", session=None):
+    """
+    Commit several files as a single commit through the Git Data API.
+
+    Blobs are uploaded concurrently, then one tree, one commit and one ref
+    update are created. Returns the response of the last request made, so
+    callers check status_code as with update_file.
+
+    The Git Data API rejects empty repositories, so there the first file is
+    seeded through the contents API on the default branch (branch must name
+    it) and the rest follow in a second commit: two commits, not one.
+    """
+    if not files:
+        # Nothing to commit is a no-op, not an error
+        return PaginatedResponse({}, 200, {})
+    session = session or _session
+    base = f"https://api.github.com/repos/{username}/{repo_name}/git"
+    items = list(files.items())
+
+    ref_resp = github_request("GET", f"{base}/ref/heads/{branch}", token, session=session)
+    if ref_resp.status_code != 200:
+        # The Git Data API refuses empty repositories; the first file creates the branch
+        path, content = items.pop(0)
+        seed_resp = update_file(username, repo_name, path, content, token, message, session=session)
+        if seed_resp.status_code not in [200, 201] or not items:
+            return seed_resp
+        ref_resp = github_request("GET", f"{base}/ref/heads/{branch}", token, session=session)
+        if ref_resp.status_code != 200:
+            return ref_resp
+    parent_sha = ref_resp.json()["object"]["sha"]
+
+    commit_resp = github_request("GET", f"{base}/commits/{parent_sha}", token, session=session)
+    if commit_resp.status_code != 200:
+        return commit_resp
+    base_tree = commit_resp.json()["tree"]["sha"]
+
+    tree = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_UPLOADS, len(items))) as executor:
+        futures = {executor.submit(_create_blob, username, repo_name, content, token, session): path for path, content in items}
+        for future in concurrent.futures.as_completed(futures):
+            blob_resp = future.result()
+            if blob_resp.status_code != 201:
+                return blob_resp
+            tree.append({"path": futures[future], "mode": "100644", "type": "blob", "sha": blob_resp.json()["sha"]})
+
+    tree_resp = github_request("POST", f"{base}/trees", token, session=session, json={"base_tree": base_tree, "tree": tree})
+    if tree_resp.status_code != 201:
+        return tree_resp
+
+    new_commit = github_request("POST", f"{base}/commits", token, session=session,
+                                json={"message": message, "tree": tree_resp.json()["sha"], "parents": [parent_sha]})
+    if new_commit.status_code != 201:
+        return new_commit
+
+    return github_request("PATCH", f"{base}/refs/heads/{branch}", token, session=session, json={"sha": new_commit.json()["sha"]})
 
 def get_commit_history(username, repo_name, token, path=None):
     """Get commit history for a repository or specific file."""
@@ -409,10 +589,10 @@ def upload_ssh_key(token, title, key):
     data = {"title": title, "key": key}
     return github_request("POST", url, token, json=data)
 
-def delete_repo_api(username, repo_name, token):
+def delete_repo_api(username, repo_name, token, session=None):
     """Delete a GitHub repository."""
     url = f"https://api.github.com/repos/{username}/{repo_name}"
-    return github_request("DELETE", url, token)
+    return github_request("DELETE", url, token, session=session)
 
 # --- SOCIAL AUTOMATION ENDPOINTS ---
 
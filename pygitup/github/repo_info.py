@@ -1,3 +1,4 @@
+import concurrent.futures
 import questionary
 from urllib.parse import urlparse
 from .api import get_repo_info, github_request, get_commit_history, get_issues, get_contributors, get_repo_languages, get_community_profile, get_latest_release, get_repo_forks, compare_commits
@@ -77,9 +78,15 @@ def get_repo_health_metrics(username, repo_name, token):
     """Calculate repository health metrics."""
     metrics = {}
 
+    # The three lookups are independent; issue them together instead of back to back
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        commits_future = executor.submit(get_commit_history, username, repo_name, token)
+        issues_future = executor.submit(get_issues, username, repo_name, token, state='closed')
+        contrib_future = executor.submit(get_contributors, username, repo_name, token)
+
     # Get recent commits
     try:
-        commits_response = get_commit_history(username, repo_name, token)
+        commits_response = commits_future.result()
         if commits_response.status_code == 200:
             commits = commits_response.json()
             metrics['recent_commits'] = len(commits)
@@ -100,7 +107,7 @@ def get_repo_health_metrics(username, repo_name, token):
 
     # Get closed issues
     try:
-        issues_response = get_issues(username, repo_name, token, state='closed')
+        issues_response = issues_future.result()
         if issues_response.status_code == 200:
             metrics['closed_issues'] = len(issues_response.json())
         else:
@@ -110,7 +117,7 @@ def get_repo_health_metrics(username, repo_name, token):
 
     # Get contributors
     try:
-        contrib_response = get_contributors(username, repo_name, token)
+        contrib_response = contrib_future.result()
         if contrib_response.status_code == 200:
             metrics['contributors_count'] = len(contrib_response.json())
         else:
@@ -27,9 +27,8 @@ from .utils.supply_chain import run_supply_chain_scan, generate_sbom_spdx, gener
 from .github.repo import manage_repo_visibility, delete_repository
 from .github.repo_info import get_detailed_repo_info, get_fork_intelligence, parse_github_url
 from .github.ssh_ops import setup_ssh_infrastructure
-from .ui.app import run_tui
 from .utils.banner import show_banner
-from .utils.ui import display_menu, print_error, print_success, print_info, console, print_header
+from .utils.ui import display_menu, print_error, print_success, print_info, console, print_header, clear_screen
 from .utils.update import check_for_updates
 from .utils.hooks import install_pre_commit_hook, uninstall_pre_commit_hook
 from .github.api import github_request, star_repo, follow_user, check_rate_limit
@@ -406,6 +405,8 @@ def main():
             elif mode == "ssh-setup":
                 setup_ssh_infrastructure(config, github_token)
             elif mode == "tui":
+                # Textual is only needed for the dashboard; keep it off the CLI start-up path
+                from .ui.app import run_tui
                 run_tui()
             elif mode == "accounts":
                 print_header("Account & Profile Manager")
@@ -685,7 +686,7 @@ def main():
             if not is_interactive:
                 break
             input("\n⌨️  Press Enter to return to the menu...")
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             show_banner()
 
     except KeyboardInterrupt:
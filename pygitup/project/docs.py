@@ -1,9 +1,8 @@
 import os
 import re
 import ast
-import requests
 
-from ..github.api import get_repo_contents
+from ..github.api import get_repo_contents, get_session
 from ..utils.ui import print_success, print_error, print_info, print_header, print_warning
 from ..utils.ai import generate_ai_readme
 
@@ -76,34 +75,35 @@ def core_generate_docs(config, repo_name, output_dir, github_username, github_to
         if response.status_code != 200: return []
         
         contents = response.json()
-        doc_content = f"# Documentation for {repo_name}\n\n## API Reference\n\n"
+        doc_parts = [f"# Documentation for {repo_name}\n\n## API Reference\n\n"]
+        session = get_session()
         
         for item in contents:
             if item['type'] != 'file': continue
             ext = os.path.splitext(item['name'])[1]
-            file_response = requests.get(item['download_url'])
+            file_response = session.get(item['download_url'], timeout=30)
             if file_response.status_code != 200: continue
             
             content = file_response.text
             if ext == '.py':
                 docs = extract_python_docs(content, item['name'])
                 if docs['functions'] or docs['classes']:
-                    doc_content += f"### Python Module: {item['name']}\n\n"
-                    for func in docs['functions']: doc_content += f"**`{func['name']}({func['params']})`**\n{func['docstring']}\n\n"
-                    for cls in docs['classes']: doc_content += f"**`class {cls['name']}`**\n{cls['docstring']}\n\n"
+                    doc_parts.append(f"### Python Module: {item['name']}\n\n")
+                    doc_parts.extend(f"**`{func['name']}({func['params']})`**\n{func['docstring']}\n\n" for func in docs['functions'])
+                    doc_parts.extend(f"**`class {cls['name']}`**\n{cls['docstring']}\n\n" for cls in docs['classes'])
             elif ext in ['.js', '.ts', '.tsx']:
                 docs = extract_javascript_docs(content, item['name'])
                 if docs['functions'] or docs['classes']:
-                    doc_content += f"### JS/TS Module: {item['name']}\n\n"
-                    for func in docs['functions']: doc_content += f"**`{func['name']}`**\n{func['jsdoc']}\n\n"
+                    doc_parts.append(f"### JS/TS Module: {item['name']}\n\n")
+                    doc_parts.extend(f"**`{func['name']}`**\n{func['jsdoc']}\n\n" for func in docs['functions'])
             elif ext == '.go':
                 docs = extract_go_docs(content, item['name'])
                 if docs['functions']:
-                    doc_content += f"### Go Module: {item['name']}\n\n"
-                    for func in docs['functions']: doc_content += f"**`{func['name']}`**\n{func['go_doc']}\n\n"
+                    doc_parts.append(f"### Go Module: {item['name']}\n\n")
+                    doc_parts.extend(f"**`{func['name']}`**\n{func['go_doc']}\n\n" for func in docs['functions'])
 
         doc_path = os.path.join(output_dir, "API_REFERENCE.md")
-        with open(doc_path, 'w') as f: f.write(doc_content)
+        with open(doc_path, 'w') as f: f.write("".join(doc_parts))
         generated_files.append(doc_path)
         return generated_files
     except Exception: return []
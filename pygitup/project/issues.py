@@ -3,6 +3,7 @@ import re
 import os
 import subprocess
 import hashlib
+import itertools
 from ..github.api import create_issue, get_issues, search_user_by_email
 from ..utils.ui import print_success, print_error, print_info, print_warning
 from ..utils.ai import suggest_todo_fix
@@ -23,10 +24,8 @@ def get_git_author(file_path, line_num):
 def get_code_context(file_path, line_num, window=3):
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
             start = max(0, line_num - window - 1)
-            end = min(len(lines), line_num + window)
-            snippet = "".join(lines[start:end])
+            snippet = "".join(itertools.islice(f, start, line_num + window))
             return f"```python\n{snippet}\n```"
     except Exception:
         return "Context unavailable."
@@ -1,11 +1,14 @@
 
 import os
+import contextlib
+import mmap
+import posixpath
 import subprocess
 import sys
 import base64
 from tqdm import tqdm
 
-from ..github.api import update_file, get_file_info, create_repo, get_repo_info, get_user_repos
+from ..github.api import update_file, get_file_info, create_repo, get_repo_info, get_user_repos, blob_oid
 from ..utils.security import scan_directory_for_sensitive_files, audit_files_and_prompt, check_is_sensitive
 from ..utils.validation import validate_repo_name, validate_file_path, sanitize_input, normalize_repo_path, validate_git_url
 from ..utils.ui import print_header, print_info, print_success, print_error, print_warning
@@ -13,28 +16,31 @@ from ..utils.ux_helpers import estimate_file_operation_time, estimate_repo_opera
 
 TQDM_AVAILABLE = True # Assume available for now
 
+def _arg_or_prompt(args, attr, prompter):
+    """Return args.<attr> when it was supplied, otherwise ask via prompter()."""
+    value = getattr(args, attr, None) if args else None
+    return value if value not in (None, "") else prompter()
+
+def _prompt_project_path():
+    # Default to current directory
+    project_path = input("Enter the full path to your project directory (or Enter for current): ").strip()
+    if not project_path:
+        project_path = os.getcwd()
+        print_info(f"Using current directory: {project_path}")
+    return project_path
+
 def get_project_directory_input(config, args=None, github_username=None, github_token=None):
     """Gets user input for the project upload details."""
-    if args and args.path:
-        project_path = args.path
-    else:
-        # Default to current directory
-        project_path = input("Enter the full path to your project directory (or Enter for current): ").strip()
-        if not project_path:
-            project_path = os.getcwd()
-            print_info(f"Using current directory: {project_path}")
-
-    if args and args.repo:
-        repo_name = args.repo
-    else:
-        repo_name = input("Enter the desired name for your GitHub repository: ")
+    project_path = _arg_or_prompt(args, "path", _prompt_project_path)
+    repo_name = _arg_or_prompt(args, "repo", lambda: input("Enter the desired name for your GitHub repository: "))
 
     # Check if repo already exists BEFORE asking for description
     repo_exists = False
     existing_desc = None
     existing_private = None
     
-    if github_token and repo_name:
+    # --force-create means the caller expects a new repo, so skip the lookup
+    if github_token and repo_name and not getattr(args, "force_create", False):
         try:
             from ..github.api import get_repo_info
             response = get_repo_info(github_username, repo_name, github_token)
@@ -141,19 +147,31 @@ def initialize_git_repository(project_path):
     except subprocess.CalledProcessError as e:
         return False, f"Git operation failed: {e.stderr.strip() if e.stderr else str(e)}"
 
-def create_or_get_github_repository(repo_name, repo_description, is_private, github_username, github_token):
-    """Creates a new repository on GitHub or confirms an existing one."""
-    response = get_repo_info(github_username, repo_name, github_token)
-    if response.status_code == 200:
-        print_info(f"Repository '{repo_name}' already exists on GitHub. Using existing repository.")
-        return True, response.json()
+def create_or_get_github_repository(repo_name, repo_description, is_private, github_username, github_token, prefer_create=False):
+    """
+    Creates a new repository on GitHub or confirms an existing one.
+
+    With prefer_create the POST is tried first and the repository is only
+    looked up on a 422 (name already taken), saving a GET for new repos.
+    """
+    if not prefer_create:
+        response = get_repo_info(github_username, repo_name, github_token)
+        if response.status_code == 200:
+            print_info(f"Repository '{repo_name}' already exists on GitHub. Using existing repository.")
+            return True, response.json()
     
     response = create_repo(github_username, repo_name, github_token, description=repo_description, private=is_private)
     if response.status_code == 201:
         print_success(f"Successfully created repository '{repo_name}' on GitHub.")
         return True, response.json()
-    else:
-        return False, f"Error creating repository: {response.status_code} - {response.text}"
+
+    if prefer_create and response.status_code == 422:
+        existing = get_repo_info(github_username, repo_name, github_token)
+        if existing.status_code == 200:
+            print_info(f"Repository '{repo_name}' already exists on GitHub. Using existing repository.")
+            return True, existing.json()
+
+    return False, f"Error creating repository: {response.status_code} - {response.text}"
 
 def push_to_github(repo_name, github_username, github_token):
     """
@@ -256,7 +274,8 @@ def upload_project_directory(github_username, github_token, config, args=None):
 
     # Removed automatic SBOM generation - users can use Option 38 manually if needed
 
-    success, data_or_msg = create_or_get_github_repository(repo_name, repo_description, is_private, github_username, github_token)
+    prefer_create = bool(getattr(args, "force_create", False))
+    success, data_or_msg = create_or_get_github_repository(repo_name, repo_description, is_private, github_username, github_token, prefer_create=prefer_create)
     if not success:
         print_error(data_or_msg)
         return False
@@ -271,13 +290,11 @@ def upload_project_directory(github_username, github_token, config, args=None):
 
 def get_single_file_input(config, args=None):
     """Gets user input for the file upload details."""
-    if args and args.repo:
-        repo_name = args.repo
-    else:
-        repo_name = input("Enter the name of the target GitHub repository: ")
+    default_msg = config["defaults"]["commit_message"]
+    repo_name = _arg_or_prompt(args, "repo", lambda: input("Enter the name of the target GitHub repository: "))
 
-    if args and args.file:
-        local_file_path = args.file
+    local_file_path = getattr(args, "file", None) if args else None
+    if local_file_path:
         print_info(f"Selected file: {local_file_path}")
     else:
         print_header("Select a file to upload")
@@ -315,10 +332,7 @@ def get_single_file_input(config, args=None):
         print_info("Please provide the file path manually.")
         local_file_path = input("Enter the full local path of the file to upload: ")
 
-    if args and args.path:
-        repo_file_path = args.path
-    else:
-        repo_file_path = input("Enter the path for the file in the repository (e.g., folder/file.txt): ")
+    repo_file_path = _arg_or_prompt(args, "path", lambda: input("Enter the path for the file in the repository (e.g., folder/file.txt): "))
 
     # Security: Normalize path
     try:
@@ -327,13 +341,7 @@ def get_single_file_input(config, args=None):
         print_error(str(e))
         return None, None, None, None
 
-    if args and args.message:
-        commit_message = args.message
-    else:
-        default_msg = config["defaults"]["commit_message"]
-        commit_message = input(f"Enter the commit message (default: {default_msg}): ")
-        if not commit_message:
-            commit_message = default_msg
+    commit_message = _arg_or_prompt(args, "message", lambda: input(f"Enter the commit message (default: {default_msg}): ") or default_msg)
 
     return repo_name, local_file_path, repo_file_path, commit_message
 
@@ -428,6 +436,7 @@ def upload_single_file(github_username, github_token, config, args=None):
 
 def get_batch_files_input(config, args=None):
     """Get files for batch upload."""
+    default_msg = config["defaults"]["commit_message"]
     if args and args.files:
         files = [f.strip() for f in args.files.split(',') if f.strip()]
     else:
@@ -444,26 +453,10 @@ def get_batch_files_input(config, args=None):
         print_error("No files specified.")
         return None, None, None, None
     
-    repo_name = None
-    if args and args.repo:
-        repo_name = args.repo
-    else:
-        repo_name = input("Enter the name of the target GitHub repository: ")
-    
-    repo_base_path = ""
-    if args and args.path:
-        repo_base_path = args.path
-    else:
-        repo_base_path = input("Enter base path in repository (optional, e.g., src/): ")
+    repo_name = _arg_or_prompt(args, "repo", lambda: input("Enter the name of the target GitHub repository: "))
+    repo_base_path = _arg_or_prompt(args, "path", lambda: input("Enter base path in repository (optional, e.g., src/): "))
     
-    default_msg = config["defaults"]["commit_message"]
-    commit_message = ""
-    if args and args.message:
-        commit_message = args.message
-    else:
-        commit_message = input(f"Enter the commit message (default: {default_msg}): ")
-        if not commit_message:
-            commit_message = default_msg
+    commit_message = _arg_or_prompt(args, "message", lambda: input(f"Enter the commit message (default: {default_msg}): ") or default_msg)
     
     return files, repo_name, repo_base_path, commit_message
 
@@ -495,13 +488,13 @@ def upload_batch_files(github_username, github_token, config, args=None):
     
     success_count = 0
     fail_count = 0
+    continue_on_error = config["batch"]["continue_on_error"]
+    # Normalise once so the per-file join below never has to rewrite separators
+    repo_base_path = repo_base_path.replace("\\", "/") if repo_base_path else ""
     
     for local_file in file_iterator:
         try:
-            if repo_base_path:
-                repo_file_path = os.path.join(repo_base_path, os.path.basename(local_file)).replace("\\", "/")
-            else:
-                repo_file_path = os.path.basename(local_file)
+            repo_file_path = posixpath.join(repo_base_path, os.path.basename(local_file)) if repo_base_path else os.path.basename(local_file)
             
             # Use upload_single_file logic but adapted for batch
             # We skip some input gathering and validation already done
@@ -521,42 +514,44 @@ def upload_batch_files(github_username, github_token, config, args=None):
             else:
                 print_error(f"Failed to upload {local_file}: {response.status_code}")
                 fail_count += 1
-                if not config["batch"]["continue_on_error"]:
+                if not continue_on_error:
                     print_warning("Stopping batch upload due to error.")
                     break
                     
         except Exception as e:
             print_error(f"Error uploading {local_file}: {e}")
             fail_count += 1
-            if not config["batch"]["continue_on_error"]:
+            if not continue_on_error:
                 break
     
     print_success(f"\nBatch upload complete: {success_count} succeeded, {fail_count} failed.")
 
+@contextlib.contextmanager
+def _mapped_file(path):
+    """Yield a read-only, mmap-backed view of a file so pages are loaded on demand."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                view.release()
+
 def get_multi_repo_input(config, args=None):
     """Get multi-repository input."""
-    if args and args.multi_repo:
-        repo_names = [name.strip() for name in args.multi_repo.split(",")]
-    else:
-        repo_input = input("Enter repository names separated by commas: ")
-        repo_names = [name.strip() for name in repo_input.split(",")]
-    
-    if args and args.file:
-        file_path = args.file
-    else:
-        file_path = input("Enter local file to upload: ")
+    default_msg = config["defaults"]["commit_message"]
+    repo_input = _arg_or_prompt(args, "multi_repo", lambda: input("Enter repository names separated by commas: "))
+    # Empty names are dropped here so callers get a clean list
+    repo_names = [name for name in (n.strip() for n in repo_input.split(",")) if name]
     
-    if args and args.path:
-        repo_file_path = args.path
-    else:
-        repo_file_path = input("Enter repository file path: ")
+    file_path = _arg_or_prompt(args, "file", lambda: input("Enter local file to upload: "))
+    repo_file_path = _arg_or_prompt(args, "path", lambda: input("Enter repository file path: "))
     
-    if args and args.message:
-        commit_message = args.message
-    else:
-        default_msg = config["defaults"]["commit_message"]
-        msg_input = input(f"Enter commit message (default: {default_msg}): ")
-        commit_message = msg_input if msg_input else default_msg
+    commit_message = _arg_or_prompt(args, "message", lambda: input(f"Enter commit message (default: {default_msg}): ") or default_msg)
     
     return repo_names, file_path, repo_file_path, commit_message
 
@@ -570,49 +565,52 @@ def update_multiple_repos(github_username, github_token, config, args=None):
 
     print_header("Multi-Repository Update")
     repo_names, file_path, repo_file_path, commit_message = get_multi_repo_input(config, args)
-    
-    # Filter empty repo names
-    repo_names = [name for name in repo_names if name]
 
     if not os.path.exists(file_path):
         print_error(f"File '{file_path}' not found.")
         return
     
+    # Map the file instead of reading it: every worker shares the same pages
+    mapped = contextlib.ExitStack()
     try:
-        with open(file_path, "rb") as f:
-            file_content = f.read()
+        file_content = mapped.enter_context(_mapped_file(file_path))
     except Exception as e:
         print_error(f"Error reading file: {e}")
         return
 
-    print_info(f"Updating {len(repo_names)} repositories in parallel...")
+    with mapped:
+        print_info(f"Updating {len(repo_names)} repositories in parallel...")
     
-    import concurrent.futures
-    success_count = 0
+        import concurrent.futures
+        success_count = 0
+        # Git addresses blobs by content, so a matching SHA means the file is already identical
+        local_oid = blob_oid(file_content)
     
-    def update_single_repo(repo_name):
-        try:
-            # Check for SHA
-            response = get_file_info(github_username, repo_name, repo_file_path, github_token)
-            sha = response.json().get('sha') if response.status_code == 200 else None
+        def update_single_repo(repo_name):
+            try:
+                # Check for SHA
+                response = get_file_info(github_username, repo_name, repo_file_path, github_token)
+                sha = response.json().get('sha') if response.status_code == 200 else None
+                if sha == local_oid:
+                    return True, f"{repo_name} (already up to date)"
             
-            # Update
-            up_resp = update_file(github_username, repo_name, repo_file_path, file_content, github_token, commit_message, sha)
-            if up_resp.status_code in [200, 201]:
-                return True, repo_name
-            return False, f"{repo_name} (HTTP {up_resp.status_code})"
-        except Exception as e:
-            return False, f"{repo_name} ({e})"
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {executor.submit(update_single_repo, name): name for name in repo_names}
-        for future in concurrent.futures.as_completed(futures):
-            success, result = future.result()
-            if success:
-                print_success(f"Updated: {result}")
-                success_count += 1
-            else:
-                print_error(f"Failed: {result}")
+                # Update
+                up_resp = update_file(github_username, repo_name, repo_file_path, file_content, github_token, commit_message, sha)
+                if up_resp.status_code in [200, 201]:
+                    return True, repo_name
+                return False, f"{repo_name} (HTTP {up_resp.status_code})"
+            except Exception as e:
+                return False, f"{repo_name} ({e})"
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {executor.submit(update_single_repo, name): name for name in repo_names}
+            for future in concurrent.futures.as_completed(futures):
+                success, result = future.result()
+                if success:
+                    print_success(f"Updated: {result}")
+                    success_count += 1
+                else:
+                    print_error(f"Failed: {result}")
     
     print_info(f"\nMulti-repo update complete: {success_count}/{len(repo_names)} successful.")
 
@@ -663,8 +661,8 @@ def migrate_repository(github_username, github_token, config, args=None):
     is_private = args.private if args and hasattr(args, 'private') else input("🔒 Make destination private? (y/n) [y]: ").lower() != 'n'
 
     print_info(f"Establishing destination on GitHub...")
-    # Ensure dest exists
-    create_or_get_github_repository(dest_name, f"Mirrored from {src_url}", is_private, github_username, github_token)
+    # Ensure dest exists; mirror targets are normally new, so try creating first
+    create_or_get_github_repository(dest_name, f"Mirrored from {src_url}", is_private, github_username, github_token, prefer_create=True)
 
     # Authenticated URL for the single push operation
     auth_dest_url = f"https://{github_token}@github.com/{github_username}/{dest_name}.git"
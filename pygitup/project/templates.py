@@ -1,7 +1,11 @@
 
+import functools
 import os
+import re
+import shutil
 import subprocess
-from ..github.api import create_repo, update_file
+import tempfile
+from ..github.api import create_repo, commit_files_atomically, get_session
 from ..core.config import get_github_username
 from ..utils.ui import print_success, print_error, print_info, print_header, console, Table, box
 
@@ -316,6 +320,40 @@ PROJECT_TEMPLATES = {
     "rust-microservice": RUST_MICROSERVICE
 }
 
+# Built once for the selector table and ID lookups
+_TEMPLATE_NAMES = tuple(PROJECT_TEMPLATES)
+_TEMPLATE_ROWS = tuple((str(i), name, PROJECT_TEMPLATES[name]["description"]) for i, name in enumerate(_TEMPLATE_NAMES, 1))
+
+# --- PRECOMPILED TEMPLATE BODIES ---
+
+_VAR_RE = re.compile(r"\{\{(\w+)\}\}")
+
+class _TemplateVars(dict):
+    """Byte-keyed variable map; unknown placeholders render back as themselves."""
+    def __missing__(self, key):
+        return b"{{" + key + b"}}"
+
+def _compile_template_body(body):
+    """Rewrite {{VAR}} markers as %(VAR)s so a body renders with one C-level bytes % call."""
+    parts = _VAR_RE.split(body)
+    return "".join(f"%({part})s" if i % 2 else part.replace("%", "%%") for i, part in enumerate(parts)).encode('utf-8')
+
+def _encode_variables(variables):
+    """Encode template variables once per deploy; the bodies themselves are already bytes."""
+    return _TemplateVars({k.encode('utf-8'): str(v if v is not None else "").encode('utf-8') for k, v in variables.items()})
+
+def _render_bytes(body, variables):
+    """Render a precompiled body into the final file bytes."""
+    if not isinstance(variables, _TemplateVars):
+        variables = _encode_variables(variables)
+    return body % variables
+
+@functools.lru_cache(maxsize=None)
+def _compiled_template(template_name):
+    """Parses a template's bodies on first use; later deploys only substitute the variables."""
+    files = PROJECT_TEMPLATES[template_name]["files"]
+    return {path: _compile_template_body(body) for path, body in files.items()}
+
 def get_template_input(config, args=None):
     """Interactive template selector with rich UI."""
     print_header("Project Architecture Marketplace")
@@ -325,8 +363,8 @@ def get_template_input(config, args=None):
     table.add_column("Template Name", style="bold white")
     table.add_column("Description", style="dim")
     
-    for i, (name, details) in enumerate(PROJECT_TEMPLATES.items(), 1):
-        table.add_row(str(i), name, details["description"])
+    for row in _TEMPLATE_ROWS:
+        table.add_row(*row)
     
     console.print(table)
     
@@ -336,8 +374,8 @@ def get_template_input(config, args=None):
     selected_name = None
     if choice.isdigit():
         idx = int(choice) - 1
-        if 0 <= idx < len(PROJECT_TEMPLATES):
-            selected_name = list(PROJECT_TEMPLATES.keys())[idx]
+        if 0 <= idx < len(_TEMPLATE_NAMES):
+            selected_name = _TEMPLATE_NAMES[idx]
     elif choice in PROJECT_TEMPLATES:
         selected_name = choice
         
@@ -357,8 +395,59 @@ def get_template_input(config, args=None):
     
     return selected_name, repo_name, variables, is_private
 
-def core_deploy_template(template_name, repo_name, description, is_private, github_username, github_token, config):
-    """Core logic for deploying a template to GitHub with rollback support."""
+def _push_template_via_git(rendered, github_username, repo_name, github_token, branch="main"):
+    """
+    Writes the rendered files into a temporary repository and pushes them as a
+    single commit, so the whole template travels in one packfile transfer.
+    """
+    temp_dir = tempfile.mkdtemp(prefix="pygitup-template-")
+    # Authenticated URL for the single push operation (never written to config)
+    auth_remote_url = f"https://{github_token}@github.com/{github_username}/{repo_name}.git"
+    try:
+        for path, content in rendered.items():
+            full_path = os.path.join(temp_dir, *path.split("/"))
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "wb") as f:
+                f.write(content)
+
+        git = ["git", "-C", temp_dir]
+        subprocess.run(git + ["init", "-q"], check=True, capture_output=True)
+        subprocess.run(git + ["add", "-A"], check=True, capture_output=True)
+
+        # Fill in whichever half of the identity git lacks from the GitHub noreply identity
+        identity = []
+        fallback = {"user.name": github_username, "user.email": f"{github_username}@users.noreply.github.com"}
+        for key, value in fallback.items():
+            if subprocess.run(git + ["config", key], capture_output=True).returncode != 0:
+                identity += ["-c", f"{key}={value}"]
+        subprocess.run(git + identity + ["commit", "-q", "-m", "chore: initialize project from template"], check=True, capture_output=True)
+        subprocess.run(git + ["push", "-q", auth_remote_url, f"HEAD:refs/heads/{branch}"], check=True, capture_output=True)
+        return list(rendered)
+    except subprocess.CalledProcessError as e:
+        error_msg = e.stderr.decode(errors="replace").strip() if e.stderr else "git exited with an error"
+        # Never surface the token embedded in the push URL
+        raise RuntimeError(f"git push failed: {error_msg.replace(github_token, '***')}") from None
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+# Phases reported through core_deploy_template's on_progress callback, in order
+DEPLOY_PHASES = ("created", "rendered", "pushed")
+
+def _commit_template_via_git_data_api(rendered, github_username, repo_name, github_token, branch="main", session=None):
+    """Commits rendered files in one Git Data API commit; used when git is unavailable."""
+    resp = commit_files_atomically(github_username, repo_name, github_token, rendered, "chore: initialize project from template", branch=branch, session=session)
+    if resp.status_code not in [200, 201]:
+        raise RuntimeError(f"Failed to commit template files: {resp.text}")
+    return list(rendered)
+
+def core_deploy_template(template_name, repo_name, description, is_private, github_username, github_token, config, on_progress=None):
+    """
+    Core logic for deploying a template to GitHub with rollback support.
+
+    on_progress, if given, is called as on_progress(step, status) once per
+    phase in DEPLOY_PHASES, so a UI can size a progress bar to match.
+    """
+    report = on_progress or (lambda step, status: None)
     if template_name not in PROJECT_TEMPLATES:
         return False, "Template not found."
 
@@ -368,35 +457,36 @@ def core_deploy_template(template_name, repo_name, description, is_private, gith
         "AUTHOR": get_github_username(config)
     }
     
+    # One keep-alive session for every API call of this deploy
+    session = get_session()
+
     # 1. Create GitHub Repo
-    resp = create_repo(github_username, repo_name, github_token, description=description, private=is_private)
+    resp = create_repo(github_username, repo_name, github_token, description=description, private=is_private, session=session)
     if resp.status_code not in [200, 201]:
         return False, f"Cloud initialization failed: {resp.text}"
+    # Accounts and orgs can rename the default branch; never assume "main"
+    branch = resp.json().get("default_branch") or "main"
+    report(repo_name, "created")
 
     # 2. Deploy Template Files
-    template = PROJECT_TEMPLATES[template_name]
-    deployed_files = []
-    
+    encoded_vars = _encode_variables(variables)
+    rendered = {path: _render_bytes(body, encoded_vars) for path, body in _compiled_template(template_name).items()}
+    report(f"{len(rendered)} files", "rendered")
+
     try:
-        for path, content in template["files"].items():
-            # Render variables
-            final_content = content
-            for k, v in variables.items():
-                final_content = final_content.replace(f"{{{{{k}}}}}", v)
-                
-            f_resp = update_file(github_username, repo_name, path, final_content.encode('utf-8'), github_token, f"chore: initialize {path} from template")
-            if f_resp.status_code in [200, 201]:
-                deployed_files.append(path)
-            else:
-                raise RuntimeError(f"Failed to deploy {path}: {f_resp.text}")
-                
+        if shutil.which("git"):
+            deployed_files = _push_template_via_git(rendered, github_username, repo_name, github_token, branch)
+        else:
+            deployed_files = _commit_template_via_git_data_api(rendered, github_username, repo_name, github_token, branch, session=session)
+        report(f"{github_username}/{repo_name}", "pushed")
+
         return True, f"Deployed {len(deployed_files)} files to {github_username}/{repo_name}."
         
     except Exception as e:
         print_error(f"Deployment failed: {e}. Initiating rollback...")
         # Rollback: Delete the failed repository to prevent broken state
         from ..github.api import delete_repo_api
-        delete_repo_api(github_username, repo_name, github_token)
+        delete_repo_api(github_username, repo_name, github_token, session=session)
         return False, f"Deployment failed and repository was removed: {e}"
 
 def create_project_from_template(github_username, github_token, config, args=None):
@@ -1,20 +1,158 @@
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, ScrollableContainer, Grid
-from textual.widgets import Header, Footer, Static, ListItem, ListView, Label, Markdown, ContentSwitcher, Button, DataTable, Input, LoadingIndicator, Switch, RichLog
+from textual.widgets import Header, Footer, Static, ListItem, ListView, Label, Markdown, ContentSwitcher, Button, DataTable, Input, LoadingIndicator, Switch, RichLog, ProgressBar
 from textual.binding import Binding
 from rich.markdown import Markdown as RichMarkdown
+from rich.rule import Rule
+from rich.text import Text
 from .. import __version__
 from ..core.config import load_config, get_github_username, get_github_token, get_active_profile_path, list_profiles, set_active_profile
-from ..github.repo_info import get_repo_info, get_repo_health_metrics
-from ..utils.ai import get_git_diff, generate_ai_commit_message, code_mentor_chat
-from ..utils.analytics import calculate_health_score, predict_growth_v2
-from ..utils.security import run_local_sast_scan
-from ..utils.validation import get_current_repo_context, validate_file_path, validate_repo_name
+from ..utils.validation import get_current_repo_context
+from ..utils.ui import clear_screen
 import os
+import re
+import sys
+import json
+import time
 import subprocess
 import shlex
 import difflib
 import asyncio
+import concurrent.futures
+import functools
+import importlib
+import collections
+import threading
+
+# Slow-changing GitHub lookups shared by the dashboard views: key -> (fetched_at, stamp, value)
+CACHE_TTL = 60
+_CACHE = {}
+# Lookups currently running on the worker pool: key -> Future, so a second view
+# asking for the same data waits for the first request instead of repeating it
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Report layouts filled in by the OSINT and analytics workers
+_INTEL_MD = (
+    "# 🛰️ Intelligence: {owner}/{repo}\n\n"
+    "| Metric | Value |\n| --- | --- |\n"
+    "| ⭐ Stars | {stars} |\n"
+    "| 🍴 Forks | {forks} |\n"
+    "| 🌐 Language | {lang} |\n"
+    "| 🚑 Health | {health} |"
+)
+_ANALYTICS_MD = "# 📈 Momentum: {repo}\n\n- Projected Goal: {projection} 🌟"
+
+# File listing handed to the mentor as workspace context
+CONTEXT_FILE_LIMIT = 300
+CONTEXT_TTL = 10
+CONTEXT_MAX_DEPTH = 4
+_CONTEXT_EXCLUDE = frozenset({
+    ".git", "node_modules", "venv", ".venv", "__pycache__", "dist", "build",
+    ".mypy_cache", ".pytest_cache", ".tox", "target",
+})
+# Only source, docs and config files are listed; images, archives and build
+# artifacts cost prompt tokens without telling the model anything. Extensionless
+# names (Makefile, Dockerfile, LICENSE) are kept.
+_CONTEXT_EXTENSIONS = frozenset({
+    "", ".py", ".js", ".jsx", ".ts", ".tsx", ".go", ".rs", ".c", ".cpp", ".h", ".hpp",
+    ".java", ".kt", ".rb", ".php", ".cs", ".swift", ".sh", ".html", ".css", ".tcss",
+    ".md", ".rst", ".txt", ".yaml", ".yml", ".toml", ".json", ".ini", ".cfg",
+})
+
+# Findings pushed to the SAST table per UI update, and the most it will show
+SAST_ROW_BATCH = 32
+SAST_MAX_ROWS = 1000
+
+# Findings arrive grouped by file, so most basename lookups repeat the previous one
+_basename = functools.lru_cache(maxsize=2048)(os.path.basename)
+
+# Longest diff handed to the Markdown renderer; syntax highlighting is per line
+MAX_DIFF_LINES = 500
+
+# Seconds the sidebar cursor must rest before the home description is redrawn
+HIGHLIGHT_DEBOUNCE = 0.08
+
+def _cached(key, ttl, fn, *args, stamp=None):
+    """Returns fn(*args), reusing a result younger than ttl seconds. Errors are never cached.
+
+    A result stored with a different stamp is stale; passing the change marker as
+    stamp rather than in the key keeps one entry per key instead of one per change.
+    """
+    now = time.monotonic()
+    hit = _CACHE.get(key)
+    if hit and now - hit[0] < ttl and hit[1] == stamp:
+        return hit[2]
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT.get(key)
+        leader = pending is None
+        if leader:
+            pending = _INFLIGHT[key] = concurrent.futures.Future()
+    if not leader:
+        return pending.result()
+    try:
+        result = fn(*args)
+        if getattr(result, "status_code", 200) < 400:
+            _CACHE[key] = (now, stamp, result)
+        pending.set_result(result)
+        return result
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+def _scan_context_files(root=".", limit=CONTEXT_FILE_LIMIT, max_depth=CONTEXT_MAX_DEPTH):
+    """Lists up to limit files under root, breadth-first, without descending into
+    excluded dirs or more than max_depth levels down."""
+    queue = collections.deque([(root, 0)])
+    found = []
+    prefix = len(root) + 1
+    while queue:
+        path, depth = queue.popleft()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if depth < max_depth and entry.name not in _CONTEXT_EXCLUDE:
+                        queue.append((entry.path, depth + 1))
+                elif os.path.splitext(entry.name)[1].lower() in _CONTEXT_EXTENSIONS:
+                    found.append(entry.path[prefix:])
+                    if len(found) >= limit:
+                        return found
+    return found
+
+def _context_stamp(root="."):
+    """Cheap change marker for the working tree: its own mtime plus git HEAD and index mtimes."""
+    stamp = []
+    for path in (root, os.path.join(root, ".git", "HEAD"), os.path.join(root, ".git", "index")):
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def _truncate_lines(text, limit=MAX_DIFF_LINES):
+    """Keeps the first limit lines of text and notes how many were dropped."""
+    lines = text.splitlines()
+    if len(lines) <= limit:
+        return text
+    return "\n".join(lines[:limit]) + f"\n... ({len(lines) - limit} more lines truncated)"
+
+def _staged_diff():
+    """git diff --cached, or "" when git is missing or the cwd is not a repository."""
+    try:
+        return subprocess.run(["git", "diff", "--cached"], capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+def _cached_staged_diff():
+    """git diff --cached, rerun only when HEAD or the index has changed."""
+    return _cached(("staged-diff", os.getcwd()), CACHE_TTL, _staged_diff, stamp=_context_stamp())
 
 class FeatureItem(ListItem):
     """A selectable feature item in the sidebar."""
@@ -26,7 +164,17 @@ class FeatureItem(ListItem):
         self.description = description
 
     def compose(self) -> ComposeResult:
-        yield Label(f" {self.feature_name} [dim]({self.category})[/dim]")
+        # Copy so Textual can style the label without touching the shared Text
+        yield Label(_feature_text(self.feature_name, self.category).copy())
+
+@functools.lru_cache(maxsize=None)
+def _feature_text(name, category):
+    # Markup is parsed once per feature, not on every mount
+    return Text.from_markup(f" {name} [dim]({category})[/dim]")
+
+@functools.lru_cache(maxsize=None)
+def _header_text(title):
+    return Text(f" {title} ")
 
 class HeaderItem(ListItem):
     """A non-selectable header item for the list."""
@@ -35,63 +183,127 @@ class HeaderItem(ListItem):
         self.text = text
 
     def compose(self) -> ComposeResult:
-        yield Label(f" {self.text} ", classes="category-header")
+        # Plain Text skips markup parsing; styling comes from .category-header
+        yield Label(_header_text(self.text).copy(), classes="category-header")
+
+# Sidebar layout: section title -> (name, mode, category, description) entries
+_SIDEBAR_LAYOUT = (
+    ("AI ENGINEERING", (
+        ("AI Assistant", "mentor", "AI", "Autonomous task execution and file management."),
+        ("Diagnostic Tool", "ai-diagnostic", "AI", "Run commands and analyze failures."),
+        ("Commit Assistant", "ai-lab", "AI", "Automated diff analysis and commit generation."),
+    )),
+    ("DATA ANALYSIS", (
+        ("Repo Dashboard", "osint", "GitHub", "Repository metadata and statistics."),
+        ("Analytics", "analytics", "Data", "Growth trends and health scoring."),
+    )),
+    ("SECURITY", (
+        ("Static Scan (SAST)", "security", "Security", "Local vulnerability scanning."),
+        ("Profile Manager", "identity", "Auth", "Manage account profiles."),
+        ("SSH Manager", "ssh", "Auth", "Automated SSH configuration."),
+    )),
+    ("REPOSITORY OPS", (
+        ("Project Upload", "project", "Core", "Repository initialization and push."),
+        ("Marketplace", "marketplace", "Core", "Deploy project templates."),
+    )),
+    ("ADVANCED GIT OPS", (
+        ("Universal Search", "search", "Tools", "Global code and text pattern search."),
+        ("Release Manager", "release", "DevOps", "Create GitHub releases."),
+        ("Pull Requests", "pr", "Collab", "Manage open pull requests."),
+        ("Gist Manager", "gist", "Share", "Manage GitHub Gists."),
+        ("Docs Generator", "generate-docs", "Docs", "Generate project documentation."),
+    )),
+)
+
+# Backends the views import on first use; loaded in the background after first paint
+PREWARM_MODULES = (
+    "pygitup.github.repo_info",
+    "pygitup.github.ssh_ops",
+    "pygitup.utils.ai",
+    "pygitup.utils.agent_tools",
+    "pygitup.utils.analytics",
+    "pygitup.utils.security",
+    "pygitup.utils.scraper",
+    "pygitup.project.templates",
+    "pygitup.project.docs",
+)
+
+def _prewarm_imports():
+    for name in PREWARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # The owning view reports the real error when it is opened
+            pass
+
+# Modes and categories are interned so dispatch lookups and category checks
+# compare by identity; hyphenated literals like "ai-diagnostic" are not interned
+# by the compiler
+SIDEBAR_SECTIONS = tuple(
+    (title, tuple((name, sys.intern(mode), sys.intern(category), description) for name, mode, category, description in features))
+    for title, features in _SIDEBAR_LAYOUT
+)
+
+def _sidebar_items():
+    """Yields the header and feature rows of the sidebar list."""
+    for title, features in SIDEBAR_SECTIONS:
+        yield HeaderItem(title)
+        for feature in features:
+            yield FeatureItem(*feature)
 
 class PyGitUpTUI(App):
     """The PyGitUp Developer Dashboard."""
     
     TITLE = "PyGitUp Dashboard"
     SUB_TITLE = f"v{__version__}"
-    chat_history = [] 
     target_dir = os.getcwd()
     pending_tool = None
     is_online = True
     agent_busy = False
-    user_signal = asyncio.Event()
     user_response = None
-
-    CSS = """
-    Screen { background: #0d1117; color: #c9d1d9; }
-    #sidebar { 
-        width: 30%; 
-        background: #161b22; 
-        border-right: tall #30363d; 
-        transition: width 300ms in_out_cubic;
-    }
-    #sidebar.collapsed {
-        width: 0%;
-        display: none;
+    _hl_timer = None
+    _profiles_cached = None
+
+    CSS_PATH = "app.tcss"
+
+    # Sidebar mode -> view method; anything else falls back to the CLI
+    _VIEW_DISPATCH = {sys.intern(mode): handler for mode, handler in {
+        "mentor": "run_mentor_view",
+        "ai-diagnostic": "run_diagnostic_view",
+        "ai-lab": "run_ai_lab_view",
+        "project": "run_project_view",
+        "osint": "run_osint_view",
+        "analytics": "run_analytics_view",
+        "security": "run_security_view",
+        "identity": "run_identity_view",
+        "marketplace": "run_marketplace_view",
+        "release": "run_release_view",
+        "gist": "run_gist_view",
+        "ssh": "run_ssh_view",
+        "generate-docs": "run_docs_view",
+        "pr": "run_pr_view",
+        "search": "run_search_view",
+    }.items()}
+
+    # Buttons that start a worker coroutine, and buttons handled inline
+    _BUTTON_TASKS = {
+        "btn-upload-start": "upload_task",
+        "btn-docs-gen": "docs_task",
+        "btn-diag-start": "diagnostic_task",
+        "btn-pr-create": "create_pr_task",
+        "btn-gist-create": "create_gist_task",
+        "btn-ssh-gen": "ssh_task",
+        "btn-release-start": "release_task",
+        "btn-ai-gen": "ai_gen_task",
+        "btn-ai-commit": "ai_commit_task",
+        "btn-search-start": "search_task",
     }
-    #main-switcher { width: 100%; padding: 1 2; }
-    .category-header { 
-        background: #21262d; 
-        color: #58a6ff; 
-        text-style: bold; 
-        width: 100%;
-        text-align: center;
-        margin-top: 1;
+    _BUTTON_HANDLERS = {
+        "btn-switch-context": "switch_context",
+        "btn-scroll-up": "action_scroll_chat_up",
+        "btn-scroll-down": "action_scroll_chat_down",
+        "btn-scan": "run_sast_scan",
     }
-    #status-bar { height: 1; background: #21262d; color: #8b949e; text-align: center; }
-    .online { color: #3fb950; }
-    .offline { color: #f85149; }
-    ListItem { padding: 1 1; border-bottom: hkey #30363d; }
-    ListItem:hover { background: #1f6feb; }
-    ListView:focus > ListItem.--highlight { background: #238636; color: white; }
-    .title-banner { background: #1f6feb; color: white; text-style: bold; padding: 0 2; margin-bottom: 1; width: 100%; }
-    Markdown, DataTable, #log-view { height: 100%; border: solid #30363d; padding: 1; background: #0d1117; }
-    #chat-log { height: 1fr; border: solid #30363d; background: #090c10; margin-bottom: 0; overflow-y: scroll; }
-    #chat-input { border: double #58a6ff; height: 3; width: 80%; }
-    LoadingIndicator { color: #58a6ff; height: 3; display: none; }
-    LoadingIndicator.-loading { display: block; }
-    .btn-row { margin-top: 1; height: 3; }
-    Button { margin-right: 1; }
-    .form-label { margin-top: 1; color: #58a6ff; text-style: bold; }
-    .form-input { margin-bottom: 1; }
-    #project-log, #release-log, #gist-log, #docs-log, #diag-log, #pr-log, #market-log { 
-        height: 10; border: solid #30363d; background: #010409; color: #7d8590; padding: 0 1; overflow-y: scroll; 
-    }
-    .scroll-btn { min-width: 5; width: 10%; margin-left: 1; }
-    """
 
     BINDINGS = [
         Binding("q", "quit", "Quit", show=True),
@@ -117,42 +329,34 @@ class PyGitUpTUI(App):
             "security": "security-view"
         }
         if view in views:
-            self.query_one("#main-switcher").current = views[view]
-            if view == "mentor": self.query_one("#chat-input").focus()
+            self._switcher.current = views[view]
+            if view == "mentor": self._chat_input.focus()
 
     def action_show_help(self) -> None:
         """Displays a technical help overlay."""
         self.notify("PyGitUp Dashboard: Use 1-4 for quick nav, B for sidebar, Ctrl+L to reset AI.", title="Technical Guide", severity="information")
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._active_profile = os.path.splitext(os.path.basename(get_active_profile_path()))[0]
+        # Bounded pool for blocking API calls made from async workers
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="pygitup-io")
+        # Markdown last rendered into each report widget, keyed by widget id
+        self._report_md = {}
+        # Per-app conversation state; class-level mutables would be shared by
+        # every instance created in the same process
+        self.chat_history = []
+        self.user_signal = asyncio.Event()
+
     def compose(self) -> ComposeResult:
-        active_profile = os.path.basename(get_active_profile_path()).replace(".yaml", "")
         yield Header(show_clock=True)
         yield Static("Checking connectivity...", id="status-bar")
         yield Horizontal(
             Vertical(
-                Label(f" 👤 PROFILE: {active_profile.upper()} ", classes="category-header", id="profile-label"),
+                Label(f" 👤 PROFILE: {self._active_profile.upper()} ", classes="category-header", id="profile-label"),
                 ScrollableContainer(
                     ListView(
-                        HeaderItem("AI ENGINEERING"),
-                        FeatureItem("AI Assistant", "mentor", "AI", "Autonomous task execution and file management."),
-                        FeatureItem("Diagnostic Tool", "ai-diagnostic", "AI", "Run commands and analyze failures."),
-                        FeatureItem("Commit Assistant", "ai-lab", "AI", "Automated diff analysis and commit generation."),
-                        HeaderItem("DATA ANALYSIS"),
-                        FeatureItem("Repo Dashboard", "osint", "GitHub", "Repository metadata and statistics."),
-                        FeatureItem("Analytics", "analytics", "Data", "Growth trends and health scoring."),
-                        HeaderItem("SECURITY"),
-                        FeatureItem("Static Scan (SAST)", "security", "Security", "Local vulnerability scanning."),
-                        FeatureItem("Profile Manager", "identity", "Auth", "Manage account profiles."),
-                        FeatureItem("SSH Manager", "ssh", "Auth", "Automated SSH configuration."),
-                        HeaderItem("REPOSITORY OPS"),
-                        FeatureItem("Project Upload", "project", "Core", "Repository initialization and push."),
-                        FeatureItem("Marketplace", "marketplace", "Core", "Deploy project templates."),
-                        HeaderItem("ADVANCED GIT OPS"),
-                        FeatureItem("Universal Search", "search", "Tools", "Global code and text pattern search."),
-                        FeatureItem("Release Manager", "release", "DevOps", "Create GitHub releases."),
-                        FeatureItem("Pull Requests", "pr", "Collab", "Manage open pull requests."),
-                        FeatureItem("Gist Manager", "gist", "Share", "Manage GitHub Gists."),
-                        FeatureItem("Docs Generator", "generate-docs", "Docs", "Generate project documentation."),
+                        *_sidebar_items(),
                         id="feature-list"
                     )
                 ),
@@ -241,6 +445,7 @@ class PyGitUpTUI(App):
                 Vertical(
                     Static("🛡️ STATIC SCAN (SAST)", classes="title-banner"),
                     DataTable(id="security-table"),
+                    LoadingIndicator(id="sast-loader"),
                     Horizontal(Button("Run Security Scan", variant="primary", id="btn-scan"), classes="btn-row"),
                     id="security-view"
                 ),
@@ -252,6 +457,7 @@ class PyGitUpTUI(App):
                         Button("Python CLI", id="tpl-cli"),
                         id="marketplace-grid"
                     ),
+                    ProgressBar(id="deploy-progress", show_eta=False),
                     Static("", id="market-log"),
                     id="marketplace-view"
                 ),
@@ -373,6 +579,15 @@ class PyGitUpTUI(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Widgets touched by event handlers and workers; resolved once instead of per event
+        self._switcher = self.query_one("#main-switcher", ContentSwitcher)
+        self._home_desc = self.query_one("#home-desc", Static)
+        self._intel_report = self.query_one("#intel-report", Markdown)
+        self._analytics_report = self.query_one("#analytics-report", Markdown)
+        self._chat_log = self.query_one("#chat-log", RichLog)
+        self._chat_input = self.query_one("#chat-input", Input)
+        self._chat_loader = self.query_one("#chat-loader", LoadingIndicator)
+        self._status_bar = self.query_one("#status-bar", Static)
         self.query_one("#feature-list").focus()
         self.title = self.TITLE
         self.query_one("#security-table", DataTable).add_columns("Type", "File", "Context")
@@ -390,6 +605,38 @@ class PyGitUpTUI(App):
         # Start connectivity monitor
         self.set_interval(30, self.update_status_bar)
 
+        # Import the view backends while the user reads the home screen, so the
+        # first click does not pay for them (start-up itself stays lazy)
+        self.call_after_refresh(self._pool.submit, _prewarm_imports)
+
+    def on_unmount(self) -> None:
+        try:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            # cancel_futures is Python 3.9+; queued lookups just run out on older interpreters
+            self._pool.shutdown(wait=False)
+
+    def show_report(self, widget, markdown):
+        """Updates a report widget, skipping the Markdown re-parse when nothing changed."""
+        if self._report_md.get(widget.id) == markdown:
+            return
+        self._report_md[widget.id] = markdown
+        widget.update(markdown)
+
+    def run_blocking(self, fn, *args):
+        """Runs a synchronous call on the I/O pool and returns an awaitable."""
+        return asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    def action_refresh(self) -> None:
+        """Drops cached GitHub data and reloads the current view."""
+        _CACHE.clear()
+        current = self._switcher.current
+        if current == "osint-view":
+            self.run_worker(self.fetch_intel_task(), exclusive=True, group="intel")
+        elif current == "analytics-view":
+            self.run_worker(self.fetch_analytics_task(), exclusive=True, group="analytics")
+        self.notify("Synced")
+
     def action_toggle_sidebar(self) -> None:
         """Toggles the sidebar visibility."""
         sidebar = self.query_one("#sidebar")
@@ -402,11 +649,19 @@ class PyGitUpTUI(App):
         """Clears the chat history and log."""
         self.chat_history = []
         self.save_chat_session()
-        log = self.query_one("#chat-log")
+        log = self._chat_log
         log.clear()
         log.write(RichMarkdown("# Chat Cleared"))
         self.notify("Chat history cleared")
 
+    def action_scroll_chat_up(self) -> None:
+        """Scrolls the chat log up."""
+        self._chat_log.scroll_up()
+
+    def action_scroll_chat_down(self) -> None:
+        """Scrolls the chat log down."""
+        self._chat_log.scroll_down()
+
     def save_chat_session(self):
         """Persists the current chat history to disk with secret scrubbing."""
         try:
@@ -436,13 +691,12 @@ class PyGitUpTUI(App):
                     self.chat_history = json.load(f)
                 
                 # Render history to log
-                log = self.query_one("#chat-log")
+                log = self._chat_log
                 log.write(RichMarkdown("# ⏳ Session Restored"))
                 for msg in self.chat_history:
                     role = "You" if msg['role'] == 'user' else "AI Assistant"
                     if msg.get('text'):
                         # Strip thought tags for history display to keep it clean
-                        import re
                         display_text = re.sub(r'<thought>.*?</thought>', '', msg['text'], flags=re.DOTALL).strip()
                         if display_text:
                             log.write(RichMarkdown(f"---\n**{role}**\n{display_text}"))
@@ -450,28 +704,28 @@ class PyGitUpTUI(App):
 
     async def update_status_bar(self):
         """Monitors connectivity in a non-blocking worker."""
-        self.run_worker(self.check_connectivity())
+        self.run_worker(self.check_connectivity(), exclusive=True, group="connectivity")
 
     async def check_connectivity(self):
-        import requests
-        from ..github.api import check_rate_limit
+        from ..github.api import check_rate_limit, get_session
         from ..core.config import get_github_token
         is_up = False
         rate_limit_str = ""
+        session = get_session()
         
         # 1. Fetch Rate Limit (Internal data)
         config = load_config()
         token = get_github_token(config)
         if token:
-            rl = check_rate_limit(token)
+            rl = await self.run_blocking(check_rate_limit, token)
             if rl:
                 rate_limit_str = f" | 🔑 {rl.remaining}/{rl.limit}"
 
         # 2. Check targets
         for target in ["https://github.com", "https://google.com"]:
             try:
-                # Use a very short timeout for responsiveness
-                resp = requests.get(target, timeout=3)
+                # HEAD over the pooled keep-alive session: no page body, no new TLS handshake every 30s
+                resp = await self.run_blocking(lambda: session.head(target, timeout=3))
                 if resp.status_code < 400:
                     is_up = True
                     break
@@ -480,107 +734,100 @@ class PyGitUpTUI(App):
         
         if is_up:
             self.is_online = True
-            self.query_one("#status-bar").update(f"[bold][@click=app.sync]📡 ONLINE[/] | System Operational{rate_limit_str}[/bold]")
-            self.query_one("#status-bar").set_classes("online")
+            self._status_bar.update(f"[bold][@click=app.sync]📡 ONLINE[/] | System Operational{rate_limit_str}[/bold]")
+            self._status_bar.set_classes("online")
         else:
             self.is_online = False
-            self.query_one("#status-bar").update("[bold]🔌 OFFLINE[/bold] | Actions will be queued")
-            self.query_one("#status-bar").set_classes("offline")
+            self._status_bar.update("[bold]🔌 OFFLINE[/bold] | Actions will be queued")
+            self._status_bar.set_classes("offline")
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         if event.list_view.id == "feature-list" and event.item and isinstance(event.item, FeatureItem):
-            if self.query_one("#main-switcher").current == "home-view":
-                self.query_one("#home-desc").update(f"{event.item.description}\n\n[bold white]Press ENTER to activate.[/bold white]")
+            if self._switcher.current == "home-view":
+                # Coalesce key-repeat scrolling: only the item the cursor settles on is rendered
+                if self._hl_timer:
+                    self._hl_timer.stop()
+                description = event.item.description
+                self._hl_timer = self.set_timer(HIGHLIGHT_DEBOUNCE, lambda: self._home_desc.update(f"{description}\n\n[bold white]Press ENTER to activate.[/bold white]"))
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.list_view.id == "feature-list":
             if not isinstance(event.item, FeatureItem):
                 return
-            mode = event.item.mode
-            if mode == "mentor":
-                self.run_mentor_view()
-            elif mode == "ai-diagnostic":
-                self.run_diagnostic_view()
-            elif mode == "ai-lab":
-                self.run_ai_lab_view()
-            elif mode == "project":
-                self.run_project_view()
-            elif mode == "osint":
-                self.run_osint_view()
-            elif mode == "analytics":
-                self.run_analytics_view()
-            elif mode == "security":
-                self.run_security_view()
-            elif mode == "identity":
-                self.run_identity_view()
-            elif mode == "marketplace":
-                self.run_marketplace_view()
-            elif mode == "release":
-                self.run_release_view()
-            elif mode == "gist":
-                self.run_gist_view()
-            elif mode == "ssh":
-                self.run_ssh_view()
-            elif mode == "generate-docs":
-                self.run_docs_view()
-            elif mode == "pr":
-                self.run_pr_view()
-            elif mode == "search":
-                self.run_search_view()
+            handler = self._VIEW_DISPATCH.get(event.item.mode)
+            if handler:
+                getattr(self, handler)()
             else:
-                self.launch_cli_fallback(mode)
+                self.launch_cli_fallback(event.item.mode)
         elif event.list_view.id == "profile-list":
             if not event.item:
                 return
             profile_name = str(event.item.query_one(Label).renderable).replace("🔑 ", "")
             success, msg = set_active_profile(profile_name)
             if success:
+                self._active_profile = profile_name
+                # Cached lookups were made with the previous profile's token
+                _CACHE.clear()
+                self._report_md.clear()
                 self.notify(f"Switched to: {profile_name.upper()}")
                 self.query_one("#profile-label").update(f" 👤 PROFILE: {profile_name.upper()} ")
             else:
                 self.notify(msg, severity="error")
 
     def run_mentor_view(self):
-        self.query_one("#main-switcher").current = "mentor-view"
-        self.query_one("#chat-input").focus()
+        self._switcher.current = "mentor-view"
+        self._chat_input.focus()
         if not self.chat_history:
-            self.query_one("#chat-log").write(RichMarkdown("# AI Assistant Initialized"))
+            self._chat_log.write(RichMarkdown("# AI Assistant Initialized"))
 
     def run_diagnostic_view(self):
-        self.query_one("#main-switcher").current = "diagnostic-view"
+        self._switcher.current = "diagnostic-view"
 
     def run_project_view(self):
-        self.query_one("#main-switcher").current = "project-view"
+        self._switcher.current = "project-view"
 
     def run_osint_view(self):
-        self.query_one("#main-switcher").current = "osint-view"
-        self.run_worker(self.fetch_intel_task())
+        # One repaint for the view switch and the placeholder
+        with self.batch_update():
+            self._switcher.current = "osint-view"
+            # Keep showing the previous report while it is refreshed
+            if self._intel_report.id not in self._report_md:
+                self._intel_report.update("# 📡 Gathering repository intelligence...")
+        self.run_worker(self.fetch_intel_task(), exclusive=True, group="intel")
 
     def run_analytics_view(self):
-        self.query_one("#main-switcher").current = "analytics-view"
-        self.run_worker(self.fetch_analytics_task())
+        with self.batch_update():
+            self._switcher.current = "analytics-view"
+            if self._analytics_report.id not in self._report_md:
+                self._analytics_report.update("# 📈 Computing momentum...")
+        self.run_worker(self.fetch_analytics_task(), exclusive=True, group="analytics")
 
     def run_security_view(self):
-        self.query_one("#main-switcher").current = "security-view"
+        self._switcher.current = "security-view"
 
     def run_identity_view(self):
-        self.query_one("#main-switcher").current = "identity-view"
-        p_list = self.query_one("#profile-list", ListView)
-        p_list.clear()
-        for p in list_profiles():
-            p_list.append(ListItem(Label(f"🔑 {p}")))
+        profiles = tuple(list_profiles())
+        with self.batch_update():
+            self._switcher.current = "identity-view"
+            # Rebuild the rows only when the set of profiles on disk has changed
+            if profiles == self._profiles_cached:
+                return
+            p_list = self.query_one("#profile-list", ListView)
+            p_list.clear()
+            p_list.extend(ListItem(Label(f"🔑 {p}")) for p in profiles)
+            self._profiles_cached = profiles
 
     def run_marketplace_view(self):
-        self.query_one("#main-switcher").current = "marketplace-view"
+        self._switcher.current = "marketplace-view"
 
     def run_release_view(self):
-        self.query_one("#main-switcher").current = "release-view"
+        self._switcher.current = "release-view"
 
     def run_gist_view(self):
-        self.query_one("#main-switcher").current = "gist-view"
+        self._switcher.current = "gist-view"
 
     def run_ssh_view(self):
-        self.query_one("#main-switcher").current = "ssh-view"
+        self._switcher.current = "ssh-view"
         key_path = os.path.expanduser("~/.ssh/pygitup_id_rsa.pub")
         if os.path.exists(key_path):
             self.query_one("#ssh-status-view").update(f"✅ **Key Found:** `{key_path}`")
@@ -588,28 +835,35 @@ class PyGitUpTUI(App):
             self.query_one("#ssh-status-view").update("❌ **No Key Found**")
 
     def run_docs_view(self):
-        self.query_one("#main-switcher").current = "docs-view"
+        self._switcher.current = "docs-view"
 
     def run_pr_view(self):
-        self.query_one("#main-switcher").current = "pr-view"
-        self.run_worker(self.list_prs_task())
+        self._switcher.current = "pr-view"
+        self.run_worker(self.list_prs_task(), exclusive=True, group="pr-list")
 
     def run_search_view(self):
-        self.query_one("#main-switcher").current = "search-view"
+        self._switcher.current = "search-view"
 
     def action_go_home(self):
-        self.query_one("#main-switcher").current = "home-view"
+        self._switcher.current = "home-view"
 
     def run_ai_lab_view(self):
-        self.query_one("#main-switcher").current = "ai-lab-view"
         log = self.query_one("#ai-diff-log")
-        log.clear()
+        with self.batch_update():
+            self._switcher.current = "ai-lab-view"
+            log.clear()
+            log.write("[dim]Loading staged diff...[/dim]")
+        self.run_worker(self.load_staged_diff_task(log), exclusive=True, group="ai-diff")
+
+    async def load_staged_diff_task(self, log):
         try:
-            diff = subprocess.run(["git", "diff", "--cached"], capture_output=True, text=True).stdout
+            # git can take seconds on large repos; keep the event loop free meanwhile
+            diff = await self.run_blocking(_cached_staged_diff)
+            log.clear()
             if not diff:
                 log.write("[yellow]No staged changes. Use 'git add' first.[/yellow]")
             else:
-                log.write(RichMarkdown(f"### Staged Diff\n```diff\n{diff}\n```"))
+                log.write(RichMarkdown(f"### Staged Diff\n```diff\n{_truncate_lines(diff)}\n```"))
         except Exception as e:
             log.write(f"[red]Error: {e}[/red]")
 
@@ -635,38 +889,38 @@ class PyGitUpTUI(App):
                 return
             
             # Context Injection Processor (@file)
-            import re
             processed_query = query
             file_matches = re.findall(r'@(\S+)', query)
             
-            injected_context = ""
-            if file_matches:
-                for filename in file_matches:
-                    if os.path.exists(filename) and os.path.isfile(filename):
-                        try:
-                            with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-                                content = f.read()
-                                # Safety truncation for large files
-                                if len(content) > 15000:
-                                    content = content[:15000] + "\n... [TRUNCATED FOR SPEED] ..."
-                                injected_context += f"\n--- CONTENT OF {filename} ---\n{content}\n--- END OF {filename} ---\n"
-                        except Exception as e:
-                            injected_context += f"\n[Error reading {filename}: {e}]\n"
+            injected = []
+            for filename in file_matches:
+                if os.path.isfile(filename):
+                    try:
+                        with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+                            # Safety truncation for large files; never read past the cap
+                            content = f.read(15001)
+                        if len(content) > 15000:
+                            content = content[:15000] + "\n... [TRUNCATED FOR SPEED] ..."
+                        injected.append(f"\n--- CONTENT OF {filename} ---\n{content}\n--- END OF {filename} ---\n")
+                    except Exception as e:
+                        injected.append(f"\n[Error reading {filename}: {e}]\n")
+            injected_context = "".join(injected)
             
             if injected_context:
                 processed_query += f"\n\n[USER CONTEXT INJECTION]:\n{injected_context}"
-                self.query_one("#chat-log").write(RichMarkdown(f"📎 **Injected {len(file_matches)} file(s) into context.**"))
+                self._chat_log.write(RichMarkdown(f"📎 **Injected {len(file_matches)} file(s) into context.**"))
 
             # Start a new interaction - DO NOT append to history here, mentor_task handles it
-            self.query_one("#chat-log").write(RichMarkdown(f"---\n👤 **You**\n{query}"))
-            self.query_one("#chat-loader").add_class("-loading")
+            # The user's own text is shown verbatim; only model replies go through Markdown
+            self._chat_log.write(Rule(style="dim"))
+            self._chat_log.write(Text.assemble(("👤 You", "bold"), "\n", query))
+            self._chat_loader.add_class("-loading")
             self.agent_busy = True
             self.run_worker(self.mentor_task(processed_query))
 
     async def mentor_task(self, initial_query):
         from ..utils.ai import code_mentor_chat
         from ..utils.agent_tools import execute_agent_tool
-        import re
         
         turn_count = 0
         max_turns = 10
@@ -678,7 +932,7 @@ class PyGitUpTUI(App):
                 
                 # Warn user when approaching turn limit
                 if turn_count >= max_turns - 2:
-                    self.query_one("#chat-log").write(RichMarkdown(f"⚠️ **Approaching turn limit:** {max_turns - turn_count} turns remaining"))
+                    self._chat_log.write(RichMarkdown(f"⚠️ **Approaching turn limit:** {max_turns - turn_count} turns remaining"))
 
                 # Add current query to history (Initial query or 'Proceed' message)
                 self.chat_history.append({"role": "user", "text": query})
@@ -691,7 +945,7 @@ class PyGitUpTUI(App):
                 self.chat_history = self.chat_history[-20:]
                 
                 # Pass history WITHOUT a redundant query parameter to ensure strict alternation
-                resp = code_mentor_chat(ai_key, None, ctx, history=self.chat_history)
+                resp = await self.run_blocking(functools.partial(code_mentor_chat, ai_key, None, ctx, history=self.chat_history))
                 agent_msg = {"role": "model", "text": resp['text'], "tool_calls": resp['tool_calls']}
                 self.chat_history.append(agent_msg)
                 
@@ -702,11 +956,11 @@ class PyGitUpTUI(App):
                 if thought_match:
                     thought = thought_match.group(1).strip()
                     main_response = full_text.replace(thought_match.group(0), "").strip()
-                    self.query_one("#chat-log").write(RichMarkdown(f"> 🧠 **Agent Thought:**\n> *{thought}*"))
+                    self._chat_log.write(RichMarkdown(f"> 🧠 **Agent Thought:**\n> *{thought}*"))
                     if main_response:
-                        self.query_one("#chat-log").write(RichMarkdown(f"---\n🤖 **AI Assistant**\n{main_response}"))
+                        self._chat_log.write(RichMarkdown(f"---\n🤖 **AI Assistant**\n{main_response}"))
                 elif full_text:
-                    self.query_one("#chat-log").write(RichMarkdown(f"---\n🤖 **AI Assistant**\n{full_text}"))
+                    self._chat_log.write(RichMarkdown(f"---\n🤖 **AI Assistant**\n{full_text}"))
                 
                 # Persist Session after every turn
                 self.save_chat_session()
@@ -715,7 +969,7 @@ class PyGitUpTUI(App):
                     break
                 
                 # UX: Communicate tool usage
-                self.query_one("#chat-log").write(RichMarkdown(f"⚙️ **Agent is executing {len(resp['tool_calls'])} tool(s)...**"))
+                self._chat_log.write(RichMarkdown(f"⚙️ **Agent is executing {len(resp['tool_calls'])} tool(s)...**"))
 
                 for tc in resp['tool_calls']:
                     if tc['name'] in ["write_file", "patch_file", "run_shell", "github_issue", "ask_user"]:
@@ -724,12 +978,12 @@ class PyGitUpTUI(App):
                         
                         # Special handling for ask_user: present question directly
                         if tc['name'] == "ask_user":
-                            self.query_one("#chat-log").write(RichMarkdown(f"❓ **QUESTION:** {tc['args'].get('question')}"))
-                            self.query_one("#chat-input").placeholder = "Type your answer..."
+                            self._chat_log.write(RichMarkdown(f"❓ **QUESTION:** {tc['args'].get('question')}"))
+                            self._chat_input.placeholder = "Type your answer..."
                         # Special handling for comments: Ask for the text
                         elif tc['name'] == "github_issue" and tc['args'].get('action') == "comment":
-                            self.query_one("#chat-log").write(RichMarkdown(f"📝 **Comment required for Issue #{tc['args'].get('number')}**"))
-                            self.query_one("#chat-input").placeholder = "Type your comment and press Enter..."
+                            self._chat_log.write(RichMarkdown(f"📝 **Comment required for Issue #{tc['args'].get('number')}**"))
+                            self._chat_input.placeholder = "Type your comment and press Enter..."
                         else:
                             # Show diff if applicable
                             if tc['name'] in ["write_file", "patch_file"]:
@@ -750,28 +1004,28 @@ class PyGitUpTUI(App):
                                         tofile=f"b/{path}", 
                                         lineterm=""
                                     )
-                                    diff_text = "\n".join(list(diff))
+                                    diff_text = _truncate_lines("\n".join(diff))
                                     if diff_text:
-                                        self.query_one("#chat-log").write(RichMarkdown(f"### 🔍 Proposed Changes for `{path}`\n```diff\n{diff_text}\n```"))
+                                        self._chat_log.write(RichMarkdown(f"### 🔍 Proposed Changes for `{path}`\n```diff\n{diff_text}\n```"))
                                 except Exception: pass
                             
-                            self.query_one("#chat-log").write(RichMarkdown(f"⚠️ **APPROVAL REQUIRED:** `{tc['name']}`"))
-                            self.query_one("#chat-input").placeholder = "Type 'y' to confirm or anything else to deny..."
+                            self._chat_log.write(RichMarkdown(f"⚠️ **APPROVAL REQUIRED:** `{tc['name']}`"))
+                            self._chat_input.placeholder = "Type 'y' to confirm or anything else to deny..."
 
                         # PAUSE: Wait for user to submit input via on_input_submitted
-                        self.query_one("#chat-loader").remove_class("-loading")
+                        self._chat_loader.remove_class("-loading")
                         self.user_signal.clear()
                         try:
                             # Add timeout to prevent indefinite hanging (5 minutes)
                             await asyncio.wait_for(self.user_signal.wait(), timeout=300)
                         except asyncio.TimeoutError:
                             # Handle timeout - cancel the operation
-                            self.query_one("#chat-log").write(RichMarkdown("⏰ **Timeout:** No response received. Operation cancelled."))
+                            self._chat_log.write(RichMarkdown("⏰ **Timeout:** No response received. Operation cancelled."))
                             self.agent_busy = False
-                            self.query_one("#chat-loader").remove_class("-loading")
+                            self._chat_loader.remove_class("-loading")
                             self.pending_tool = None
                             self.user_response = None
-                            self.query_one("#chat-input").placeholder = "Ask a technical question..."
+                            self._chat_input.placeholder = "Ask a technical question..."
                             return  # Exit mentor_task
                         
                         user_val = self.user_response
@@ -780,20 +1034,20 @@ class PyGitUpTUI(App):
                             user_val = ""
                         self.user_response = None
                         self.pending_tool = None
-                        self.query_one("#chat-input").placeholder = "Ask a technical question..."
-                        self.query_one("#chat-loader").add_class("-loading")
+                        self._chat_input.placeholder = "Ask a technical question..."
+                        self._chat_loader.add_class("-loading")
 
                         # Process the user's choice with error handling
                         if tc['name'] == "ask_user":
                             result = {"response": user_val}
-                            self.query_one("#chat-log").write(RichMarkdown(f"💬 **You:** {user_val}"))
+                            self._chat_log.write(Text.assemble(("💬 You: ", "bold"), user_val))
                         elif tc['name'] == "github_issue" and tc['args'].get('action') == "comment":
                             try:
                                 tc['args']['body'] = user_val
-                                result = execute_agent_tool(tc['name'], tc['args'])
-                                self.query_one("#chat-log").write(RichMarkdown(f"💬 **Comment Posted**"))
+                                result = await self.run_blocking(execute_agent_tool, tc['name'], tc['args'])
+                                self._chat_log.write(RichMarkdown(f"💬 **Comment Posted**"))
                             except Exception as e:
-                                self.query_one("#chat-log").write(RichMarkdown(f"❌ **Comment Error:** {e}"))
+                                self._chat_log.write(RichMarkdown(f"❌ **Comment Error:** {e}"))
                                 result = {"error": f"Comment failed: {e}"}
                         elif user_val.lower() in ['y', 'yes']:
                             # Create and verify safety checkpoint before modification
@@ -802,73 +1056,92 @@ class PyGitUpTUI(App):
                                 from ..utils.agent_tools import create_git_checkpoint
                                 checkpoint_id = create_git_checkpoint(f"Before {tc['name']}")
                                 if checkpoint_id:
-                                    self.query_one("#chat-log").write(RichMarkdown("🛡️ **Safety Checkpoint Verified** (Restore via `git stash list`)"))
+                                    self._chat_log.write(RichMarkdown("🛡️ **Safety Checkpoint Verified** (Restore via `git stash list`)"))
                                     checkpoint_created = True
                                 else:
-                                    self.query_one("#chat-log").write(RichMarkdown("⚠️ **Warning:** Safety checkpoint failed. Proceed with caution."))
+                                    self._chat_log.write(RichMarkdown("⚠️ **Warning:** Safety checkpoint failed. Proceed with caution."))
 
-                            self.query_one("#chat-log").write(RichMarkdown(f"✅ **APPROVED:** `{tc['name']}`"))
+                            self._chat_log.write(RichMarkdown(f"✅ **APPROVED:** `{tc['name']}`"))
                             try:
-                                result = execute_agent_tool(tc['name'], tc['args'])
+                                result = await self.run_blocking(execute_agent_tool, tc['name'], tc['args'])
                             except Exception as e:
-                                self.query_one("#chat-log").write(RichMarkdown(f"❌ **Tool Execution Error:** {e}"))
+                                self._chat_log.write(RichMarkdown(f"❌ **Tool Execution Error:** {e}"))
                                 result = {"error": f"Tool failed: {e}"}
                         else:
-                            self.query_one("#chat-log").write(RichMarkdown(f"❌ **DENIED:** `{tc['name']}`"))
+                            self._chat_log.write(RichMarkdown(f"❌ **DENIED:** `{tc['name']}`"))
                             result = {"error": "User denied action."}
                     else:
                         # Non-privileged tools: Execute immediately with error handling
                         try:
-                            result = execute_agent_tool(tc['name'], tc['args'])
+                            result = await self.run_blocking(execute_agent_tool, tc['name'], tc['args'])
                         except Exception as e:
-                            self.query_one("#chat-log").write(RichMarkdown(f"❌ **Tool Error:** {e}"))
+                            self._chat_log.write(RichMarkdown(f"❌ **Tool Error:** {e}"))
                             result = {"error": f"Tool failed: {e}"}
                     
                     self.chat_history.append({"role": "user", "text": "", "tool_results": [{"name": tc['name'], "content": result}]})
                 
                 query = "Proceed with results."
         except Exception as e:
-            self.query_one("#chat-log").write(RichMarkdown(f"❌ **Task Error:** {e}"))
+            self._chat_log.write(RichMarkdown(f"❌ **Task Error:** {e}"))
         finally:
             self.agent_busy = False
-            self.query_one("#chat-loader").remove_class("-loading")
+            self._chat_loader.remove_class("-loading")
 
     async def fetch_intel_task(self):
+        from ..github.repo_info import get_repo_info, get_repo_health_metrics
+        from ..utils.scraper import scrape_repo_info
         owner, repo = get_current_repo_context()
         if not owner or not repo:
             return
         config = load_config()
         token = get_github_token(config)
         try:
-            resp = get_repo_info(owner, repo, token)
+            # The three lookups are independent; overlap them off the event loop
+            resp, health, scraped = await asyncio.gather(
+                self.run_blocking(_cached, ("info", owner, repo), CACHE_TTL, get_repo_info, owner, repo, token),
+                self.run_blocking(_cached, ("health", owner, repo), CACHE_TTL, get_repo_health_metrics, owner, repo, token),
+                self.run_blocking(_cached, ("scrape", owner, repo), CACHE_TTL, scrape_repo_info, f"https://github.com/{owner}/{repo}"),
+                return_exceptions=True,
+            )
+            # Only the repo info is essential; the health metrics and scrape are extras
+            if isinstance(resp, Exception):
+                raise resp
+            if isinstance(health, Exception):
+                health = {}
+            if isinstance(scraped, Exception):
+                scraped = None
             if resp.status_code == 200:
                 data = resp.json()
-                health = get_repo_health_metrics(owner, repo, token)
-                from ..utils.scraper import scrape_repo_info
-                scraped = scrape_repo_info(f"https://github.com/{owner}/{repo}")
-                md = f"# 🛰️ Intelligence: {owner}/{repo}\n\n| Metric | Value |\n| --- | --- |\n| ⭐ Stars | {data.get('stargazers_count')} |\n| 🚑 Health | {health.get('activity_status', 'N/A')} |"
+                parts = [_INTEL_MD.format(
+                    owner=owner, repo=repo,
+                    stars=data.get('stargazers_count'),
+                    forks=data.get('forks_count'),
+                    lang=data.get('language') or 'N/A',
+                    health=health.get('activity_status', 'N/A'),
+                )]
                 if scraped and scraped.get('social_links'):
-                    md += "\n## 🌐 Digital Footprint\n"
-                    for platform, url in scraped['social_links'].items():
-                        md += f"- **{platform}:** {url}\n"
-                self.query_one("#intel-report").update(md)
+                    parts.append("\n## 🌐 Digital Footprint\n")
+                    parts.extend(f"- **{platform}:** {url}\n" for platform, url in scraped['social_links'].items())
+                self.show_report(self._intel_report, "".join(parts))
         except Exception as e:
-            self.query_one("#intel-report").update(f"## ⚠️ Intel Gathering Limited\n{e}")
+            self.show_report(self._intel_report, f"## ⚠️ Intel Gathering Limited\n{e}")
 
     async def fetch_analytics_task(self):
+        from ..github.repo_info import get_repo_info
+        from ..utils.analytics import predict_growth_v2
         owner, repo = get_current_repo_context()
         if not owner or not repo:
             return
         config = load_config()
         token = get_github_token(config)
         try:
-            resp = get_repo_info(owner, repo, token)
+            resp = await self.run_blocking(_cached, ("info", owner, repo), CACHE_TTL, get_repo_info, owner, repo, token)
             if resp.status_code == 200:
                 data = resp.json()
                 proj = predict_growth_v2(data['stargazers_count'], data['created_at'], data['forks_count'])
-                self.query_one("#analytics-report").update(f"# 📈 Momentum: {repo}\n\n- Projected Goal: {proj} 🌟")
+                self.show_report(self._analytics_report, _ANALYTICS_MD.format(repo=repo, projection=proj))
         except Exception as e:
-            self.query_one("#analytics-report").update(f"## ⚠️ Analytics Unavailable\n{e}")
+            self.show_report(self._analytics_report, f"## ⚠️ Analytics Unavailable\n{e}")
 
     async def diagnostic_task(self):
         cmd = self.query_one("#diag-cmd").value
@@ -877,7 +1150,7 @@ class PyGitUpTUI(App):
         self.query_one("#diag-log").update(f"[cyan]Executing: {cmd}...[/cyan]")
         config = load_config()
         from ..utils.ai import ai_diagnostics_workflow
-        result = ai_diagnostics_workflow(config, cmd)
+        result = await self.run_blocking(ai_diagnostics_workflow, config, cmd)
         if isinstance(result, str):
             self.query_one("#diag-log").update(f"[red]Healing Proposal:[/red]\n{result}")
         elif result is True:
@@ -892,31 +1165,29 @@ class PyGitUpTUI(App):
             messages.append(f"> {msg}")
             log_widget.update("\n".join(messages))
         
-        original_cwd = os.getcwd()
+        # Pass cwd rather than chdir: pool threads resolve "." for the context scan and staged diff
+        git = functools.partial(subprocess.run, cwd=path, capture_output=True)
         try:
-            os.chdir(path)
-            subprocess.run(["git", "init"], check=True, capture_output=True)
-            subprocess.run(["git", "add", "."], check=True, capture_output=True)
-            subprocess.run(["git", "commit", "-m", "Deployment via PyGitUp", "--allow-empty"], capture_output=True)
+            await self.run_blocking(functools.partial(git, ["git", "init"], check=True))
+            await self.run_blocking(functools.partial(git, ["git", "add", "."], check=True))
+            await self.run_blocking(git, ["git", "commit", "-m", "Deployment via PyGitUp", "--allow-empty"])
             config = load_config()
             user, token = get_github_username(config), get_github_token(config)
             from ..github.api import create_repo, get_repo_info
-            if get_repo_info(user, name, token).status_code != 200:
-                create_repo(user, name, token, description=desc, private=private)
-            subprocess.run(["git", "push", "-u", "--force", f"https://{token}@github.com/{user}/{name}.git", "main"], check=True, capture_output=True)
+            if (await self.run_blocking(get_repo_info, user, name, token)).status_code != 200:
+                await self.run_blocking(functools.partial(create_repo, user, name, token, description=desc, private=private))
+            await self.run_blocking(functools.partial(git, ["git", "push", "-u", "--force", f"https://{token}@github.com/{user}/{name}.git", "main"], check=True))
             add_log("[green]SUCCESS! 🚀[/green]")
             self.notify("Project Uploaded")
         except Exception as e:
             add_log(f"[red]Error: {e}[/red]")
-        finally:
-            os.chdir(original_cwd)
 
     async def docs_task(self):
         config = load_config()
         user, token = get_github_username(config), get_github_token(config)
         owner, repo = get_current_repo_context()
         from ..project.docs import core_generate_docs
-        generated = core_generate_docs(config, repo, "docs", user, token)
+        generated = await self.run_blocking(core_generate_docs, config, repo, "docs", user, token)
         self.query_one("#docs-log").update(f"[green]Success! Generated: {len(generated)} files.[/green]")
         self.notify("Docs Generated")
 
@@ -928,8 +1199,17 @@ class PyGitUpTUI(App):
             return
         config = load_config()
         user, token = get_github_username(config), get_github_token(config)
-        from ..project.templates import core_deploy_template
-        success, msg = core_deploy_template(tpl_name, f"my-{tpl_name}", "Boilerplate", False, user, token, config)
+        from ..project.templates import core_deploy_template, DEPLOY_PHASES
+        progress = self.query_one("#deploy-progress", ProgressBar)
+        progress.update(total=len(DEPLOY_PHASES), progress=0)
+        log.update(f"[cyan]Deploying {tpl_name}...[/cyan]")
+
+        def on_progress(step, status):
+            self.call_from_thread(progress.advance, 1)
+            self.call_from_thread(log.update, f"[cyan]{status}: {step}[/cyan]")
+
+        # Network-bound; run off the event loop so the dashboard stays responsive
+        success, msg = await self.run_blocking(core_deploy_template, tpl_name, f"my-{tpl_name}", "Boilerplate", False, user, token, config, on_progress)
         if success:
             log.update(f"[green]SUCCESS! {msg}[/green]")
             self.notify("Template Deployed")
@@ -940,10 +1220,11 @@ class PyGitUpTUI(App):
         log = self.query_one("#ai-lab-log")
         config = load_config()
         ai_key = config["github"].get("ai_api_key")
-        from ..utils.ai import get_git_diff, generate_ai_commit_message
-        diff = get_git_diff()
-        if diff:
-            msg = generate_ai_commit_message(ai_key, diff)
+        from ..utils.ai import generate_ai_commit_message
+        # Usually already cached by the view's diff preview
+        diff = await self.run_blocking(_cached_staged_diff)
+        if diff.strip():
+            msg = await self.run_blocking(generate_ai_commit_message, ai_key, diff)
             if msg:
                 self.query_one("#ai-commit-msg").value = msg
                 log.update("[green]Generated![/green]")
@@ -954,7 +1235,7 @@ class PyGitUpTUI(App):
         msg = self.query_one("#ai-commit-msg").value
         if msg:
             try:
-                subprocess.run(["git", "commit", "-m", msg], check=True, capture_output=True)
+                await self.run_blocking(functools.partial(subprocess.run, ["git", "commit", "-m", msg], check=True, capture_output=True))
                 self.notify("Committed")
                 self.run_ai_lab_view()
             except Exception as e:
@@ -968,15 +1249,14 @@ class PyGitUpTUI(App):
             return
         self.notify(f"Searching for: {query}")
         from ..utils.agent_tools import search_code_tool
-        result = search_code_tool(query)
+        result = await self.run_blocking(search_code_tool, query)
         
         if isinstance(result, dict) and "matches" in result:
             matches = result["matches"]
             if not matches:
                 self.notify("No matches found.", severity="warning")
             else:
-                for line in matches:
-                    table.add_row(line)
+                table.add_rows((line,) for line in matches)
                 self.notify(f"Search Complete ({result.get('method', 'unknown')})")
         elif isinstance(result, dict) and "error" in result:
             self.notify(f"Search Error: {result['error']}", severity="error")
@@ -989,7 +1269,7 @@ class PyGitUpTUI(App):
         user, token = get_github_username(config), get_github_token(config)
         owner, repo = get_current_repo_context()
         from ..github.api import create_release
-        resp = create_release(owner, repo, token, tag, name, notes)
+        resp = await self.run_blocking(create_release, owner, repo, token, tag, name, notes)
         if resp.status_code == 201:
             self.notify("Release Created")
 
@@ -999,7 +1279,8 @@ class PyGitUpTUI(App):
         config = load_config()
         token = get_github_token(config)
         data = {"description": desc, "public": self.query_one("#gist-public").value, "files": {fname: {"content": content}}}
-        if github_request("POST", "https://api.github.com/gists", token, json=data).status_code == 201:
+        resp = await self.run_blocking(functools.partial(github_request, "POST", "https://api.github.com/gists", token, json=data))
+        if resp.status_code == 201:
             self.notify("Gist Created")
 
     async def list_gists_task(self):
@@ -1008,18 +1289,20 @@ class PyGitUpTUI(App):
         config = load_config()
         token, user = get_github_token(config), get_github_username(config)
         from ..github.api import github_request
-        resp = github_request("GET", f"https://api.github.com/users/{user}/gists", token)
+        resp = await self.run_blocking(github_request, "GET", f"https://api.github.com/users/{user}/gists", token)
         if resp.status_code == 200:
-            for g in resp.json():
-                table.add_row(list(g['files'].keys())[0], g['description'] or "", "Public" if g['public'] else "Secret", g['html_url'])
+            table.add_rows(
+                (next(iter(g['files']), ""), g['description'] or "", "Public" if g['public'] else "Secret", g['html_url'])
+                for g in resp.json()
+            )
 
     async def ssh_task(self):
         from ..utils.security import generate_ssh_key
         from ..github.api import upload_ssh_key
         config = load_config()
         token = get_github_token(config)
-        pub_key, path = generate_ssh_key(config["github"].get("email", "pygitup@user"))
-        if pub_key and upload_ssh_key(token, f"PyGitUp - {os.uname().nodename}", pub_key).status_code == 201:
+        pub_key, path = await self.run_blocking(generate_ssh_key, config["github"].get("email", "pygitup@user"))
+        if pub_key and (await self.run_blocking(upload_ssh_key, token, f"PyGitUp - {os.uname().nodename}", pub_key)).status_code == 201:
             self.notify("SSH Key Uploaded")
 
     async def list_prs_task(self):
@@ -1029,10 +1312,9 @@ class PyGitUpTUI(App):
         token = get_github_token(config)
         owner, repo = get_current_repo_context()
         from ..github.api import get_pull_requests
-        resp = get_pull_requests(owner, repo, token)
+        resp = await self.run_blocking(get_pull_requests, owner, repo, token)
         if resp.status_code == 200:
-            for pr in resp.json():
-                table.add_row(str(pr['number']), pr['title'], pr['head']['ref'], pr['base']['ref'])
+            table.add_rows((str(pr['number']), pr['title'], pr['head']['ref'], pr['base']['ref']) for pr in resp.json())
 
     async def create_pr_task(self):
         title, head, base, body = self.query_one("#pr-title").value, self.query_one("#pr-head").value, self.query_one("#pr-base").value, self.query_one("#pr-body").value
@@ -1040,101 +1322,100 @@ class PyGitUpTUI(App):
         token = get_github_token(config)
         owner, repo = get_current_repo_context()
         from ..github.api import create_pull_request
-        if create_pull_request(owner, repo, token, title, head, base, body).status_code == 201:
+        resp = await self.run_blocking(create_pull_request, owner, repo, token, title, head, base, body)
+        if resp.status_code == 201:
             self.notify("PR Created")
 
     async def manage_pr_task(self, btn_id):
         table = self.query_one("#pr-table", DataTable)
         try:
             pr_num = table.get_row_at(table.cursor_row)[0]
-        except:
+        except Exception:
+            # Empty table or no row under the cursor
             return
         config = load_config()
         token = get_github_token(config)
         owner, repo = get_current_repo_context()
         from ..github.api import github_request
         if "merge" in btn_id:
-            github_request("PUT", f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_num}/merge", token)
+            await self.run_blocking(github_request, "PUT", f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_num}/merge", token)
         elif "close" in btn_id:
-            github_request("PATCH", f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_num}", token, json={"state": "closed"})
+            await self.run_blocking(functools.partial(github_request, "PATCH", f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_num}", token, json={"state": "closed"}))
         elif "comment" in btn_id:
             self.pending_tool = {"name": "github_issue", "args": {"action": "comment", "repo": repo, "number": int(pr_num)}}
-            self.query_one("#chat-input").placeholder = f"Type comment for PR #{pr_num}..."
-            self.query_one("#chat-input").focus()
+            self._chat_input.placeholder = f"Type comment for PR #{pr_num}..."
+            self._chat_input.focus()
             self.notify("Enter comment in chat")
             return
-        self.run_worker(self.list_prs_task())
+        self.run_worker(self.list_prs_task(), exclusive=True, group="pr-list")
 
     async def gather_context_async(self):
         cwd = os.getcwd()
-        context = f"PATH: {cwd}\n"
-        count = 0
-        for root, dirs, files in os.walk("."):
-            dirs[:] = [d for d in dirs if d not in [".git", "node_modules", "venv", "__pycache__", "dist", "build"]]
-            for f in files:
-                context += f"- {os.path.relpath(os.path.join(root, f), '.')}\n"
-                count += 1
-                if count > 300: # Safety cap
-                    context += "... (truncated for speed)\n"
-                    return context[:4000]
+        files = await self.run_blocking(functools.partial(_cached, ("context", cwd), CONTEXT_TTL, _scan_context_files, stamp=_context_stamp()))
+        context = f"PATH: {cwd}\n" + "".join(f"- {f}\n" for f in files)
+        if len(files) >= CONTEXT_FILE_LIMIT: # The scan stopped at the cap
+            context += "... (truncated for speed)\n"
         return context[:4000]
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-upload-start":
-            self.run_worker(self.upload_task())
-        elif event.button.id == "btn-docs-gen":
-            self.run_worker(self.docs_task())
-        elif event.button.id == "btn-switch-context":
-            self.switch_context()
-        elif event.button.id == "btn-scroll-up":
-            self.query_one("#chat-log").scroll_up()
-        elif event.button.id == "btn-scroll-down":
-            self.query_one("#chat-log").scroll_down()
-        elif event.button.id == "btn-diag-start":
-            self.run_worker(self.diagnostic_task())
-        elif event.button.id == "btn-pr-mode-list":
+        btn_id = event.button.id
+        task = self._BUTTON_TASKS.get(btn_id)
+        if task:
+            self.run_worker(getattr(self, task)())
+            return
+        handler = self._BUTTON_HANDLERS.get(btn_id)
+        if handler:
+            getattr(self, handler)()
+        elif btn_id == "btn-pr-mode-list":
             self.query_one("#pr-switcher").current = "pr-list-view"
-            self.run_worker(self.list_prs_task())
-        elif event.button.id == "btn-pr-mode-create":
+            self.run_worker(self.list_prs_task(), exclusive=True, group="pr-list")
+        elif btn_id == "btn-pr-mode-create":
             self.query_one("#pr-switcher").current = "pr-create-view"
-        elif event.button.id == "btn-pr-create":
-            self.run_worker(self.create_pr_task())
-        elif event.button.id == "btn-gist-mode-list":
+        elif btn_id == "btn-gist-mode-list":
             self.query_one("#gist-switcher").current = "gist-list-view"
-            self.run_worker(self.list_gists_task())
-        elif event.button.id == "btn-gist-mode-create":
+            self.run_worker(self.list_gists_task(), exclusive=True, group="gist-list")
+        elif btn_id == "btn-gist-mode-create":
             self.query_one("#gist-switcher").current = "gist-create-view"
-        elif event.button.id == "btn-gist-create":
-            self.run_worker(self.create_gist_task())
-        elif event.button.id == "btn-ssh-gen":
-            self.run_worker(self.ssh_task())
-        elif event.button.id == "btn-release-start":
-            self.run_worker(self.release_task())
-        elif "btn-pr-" in event.button.id:
-            self.run_worker(self.manage_pr_task(event.button.id))
-        elif event.button.id.startswith("tpl-"):
-            self.run_worker(self.marketplace_task(event.button.id))
-        elif event.button.id == "btn-ai-gen":
-            self.run_worker(self.ai_gen_task())
-        elif event.button.id == "btn-ai-commit":
-            self.run_worker(self.ai_commit_task())
-        elif event.button.id == "btn-search-start":
-            self.run_worker(self.search_task())
-        elif event.button.id == "btn-scan":
-            self.run_sast_scan()
+        elif "btn-pr-" in btn_id:
+            self.run_worker(self.manage_pr_task(btn_id))
+        elif btn_id.startswith("tpl-"):
+            self.run_worker(self.marketplace_task(btn_id))
 
     def run_sast_scan(self):
         table = self.query_one("#security-table", DataTable)
         table.clear()
-        results = run_local_sast_scan(".")
-        for r in results:
-            table.add_row(r['type'], os.path.basename(r['file']), r['code'])
+        loader = self.query_one("#sast-loader", LoadingIndicator)
+        loader.add_class("-loading")
+        self.run_worker(functools.partial(self.sast_scan_worker, table, loader), thread=True, exclusive=True, group="sast")
+
+    def sast_scan_worker(self, table, loader):
+        from ..utils.security import iter_local_sast_scan
+        # Rows are handed to the UI in batches so findings appear while the scan runs
+        batch = []
+        shown = 0
+        try:
+            for r in iter_local_sast_scan("."):
+                if shown >= SAST_MAX_ROWS:
+                    self.call_from_thread(self.notify, f"Showing the first {SAST_MAX_ROWS} findings", severity="warning")
+                    break
+                batch.append((r['type'], _basename(r['file']), r['code']))
+                shown += 1
+                if len(batch) >= SAST_ROW_BATCH:
+                    self.call_from_thread(table.add_rows, batch)
+                    batch = []
+            if batch:
+                self.call_from_thread(table.add_rows, batch)
+            self.call_from_thread(self.notify, "Scan Complete")
+        finally:
+            self.call_from_thread(loader.remove_class, "-loading")
 
     def switch_context(self):
         new_path = self.query_one("#target-dir-input").value
         if os.path.isdir(new_path):
             os.chdir(new_path)
             self.target_dir = new_path
+            # Reports describe the previous repository; show placeholders again
+            self._report_md.clear()
             self.query_one("#lbl-current-target").update(f"Current: [green]{new_path}[/green]")
             self.notify("Context Switched")
         else:
@@ -1146,21 +1427,28 @@ class PyGitUpTUI(App):
         from ..project.templates import create_project_from_template
         config = load_config()
         user, token = get_github_username(config), get_github_token(config)
+        cli_dispatch = {
+            "ai-commit": lambda: ai_commit_workflow(user, token, config),
+            "ssh-setup": lambda: setup_ssh_infrastructure(config, token),
+            "template": lambda: create_project_from_template(user, token, config),
+        }
+        handler = cli_dispatch.get(mode)
+        if not handler:
+            self.notify(f"Feature '{mode}' migrated to TUI.")
+            return
+        error = None
         with self.suspend():
-            os.system('clear')
+            clear_screen()
             try:
-                if "ai-commit" in mode:
-                    ai_commit_workflow(user, token, config)
-                elif "ssh" in mode:
-                    setup_ssh_infrastructure(config, token)
-                elif "template" in mode:
-                    create_project_from_template(user, token, config)
-                else:
-                    print(f"Feature '{mode}' migrated to TUI.")
-                    input("\nPress Enter...")
+                handler()
             except Exception as e:
-                print(f"Error: {e}")
-                input("Press Enter...")
+                error = e
+        # Report back in the dashboard instead of blocking the terminal on input()
+        if error is not None:
+            self.notify(f"{mode} failed: {error}", severity="error")
 
 def run_tui():
     PyGitUpTUI().run()
+
+if __name__ == "__main__":
+    run_tui()
@@ -2,6 +2,7 @@ import os
 import subprocess
 import json
 import glob
+import itertools
 import concurrent.futures
 from .ui import print_info, print_success, print_error
 from ..github.api import (
@@ -14,13 +15,18 @@ from ..utils.validation import get_current_repo_context, is_safe_path
 
 REFERENCE_CONTENT_END = "REFERENCE_CONTENT_END"
 
+# Directory names the workspace scanners never descend into
+SCAN_EXCLUDE_DIRS = frozenset({".git", "node_modules", "venv", ".venv", "__pycache__", "dist"})
+
 def read_file_tool(path):
     """Reads content from a local file."""
     if not is_safe_path(path):
         return {"error": "Security Violation: Access denied to path outside workspace."}
     try:
         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+            # Read one character past the limit: enough to tell the file was cut
+            # without loading the rest of it
+            content = f.read(100001)
             # Basic truncation logic for safety
             if len(content) > 100000: # 100KB limit
                 return {"content": content[:100000], "is_truncated": True, "warning": "File truncated due to size."}
@@ -34,7 +40,7 @@ def _read_single_file_task(path):
         return path, "Error: Security Violation"
     try:
         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+            content = f.read(50001)
             if len(content) > 50000: # Smaller limit for batch read
                 return path, content[:50000] + "\n[WARNING: File truncated in batch read]"
             return path, content
@@ -72,9 +78,7 @@ def read_many_files_tool(include, exclude=None):
             results[path] = content
 
     # 3. Structured Formatting for LLM
-    llm_output = ""
-    for path, content in sorted(results.items()):
-        llm_output += f"--- {path} ---\n\n{content}\n\n"
+    llm_output = "".join(f"--- {path} ---\n\n{content}\n\n" for path, content in sorted(results.items()))
     
     if llm_output:
         llm_output += f"\n{REFERENCE_CONTENT_END}"
@@ -292,9 +296,9 @@ def search_code_tool(query, path="."):
     # Manual fallback
     matches = []
     try:
-        for root, _, files in os.walk(path):
-            if any(x in root for x in [".git", "node_modules", "venv", "__pycache__", "dist"]):
-                continue
+        for root, dirs, files in os.walk(path):
+            # Prune by name so paths like "adventure/" or "distributed/" are still searched
+            dirs[:] = [d for d in dirs if d not in SCAN_EXCLUDE_DIRS]
             for f in files:
                 fpath = os.path.join(root, f)
                 try:
@@ -368,8 +372,8 @@ def get_code_summary_tool(path="."):
     import ast
     summary = []
     try:
-        for root, _, files in os.walk(path):
-            if any(x in root for x in [".git", "node_modules", "venv", "__pycache__"]): continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if d not in SCAN_EXCLUDE_DIRS]
             for f in files:
                 if f.endswith(".py"):
                     fpath = os.path.join(root, f)
@@ -420,8 +424,9 @@ def read_file_range_tool(path, start_line, end_line):
         return {"error": "Security Violation: Access denied."}
     try:
         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-            return {"content": "".join(lines[start_line-1:end_line]), "range": [start_line, end_line]}
+            # Stop reading at end_line instead of loading the whole file
+            lines = itertools.islice(f, max(0, start_line-1), end_line)
+            return {"content": "".join(lines), "range": [start_line, end_line]}
     except Exception as e:
         return {"error": str(e)}
 
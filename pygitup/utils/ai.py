@@ -7,6 +7,11 @@ import os
 from .ui import print_info, print_error, print_warning, print_success, console, Panel
 from .agent_tools import AGENT_TOOLS_SPEC, execute_agent_tool
 
+# Shared by every AI provider call so a multi-turn agent session reuses its
+# TCP+TLS connection instead of handshaking on each turn. Kept separate from the
+# GitHub session, whose adapter interprets GitHub rate-limit headers.
+_session = requests.Session()
+
 def validate_ai_key(api_key: str, feature_name: str = "This feature") -> bool:
     """Validate AI API key and show helpful error if missing."""
     if not api_key or len(api_key.strip()) < 10:
@@ -55,7 +60,7 @@ def list_available_ai_models(api_key):
     for version in ["v1beta", "v1"]:
         url = f"https://generativelanguage.googleapis.com/{version}/models?key={api_key}"
         try:
-            response = requests.get(url, timeout=10)
+            response = _session.get(url, timeout=10)
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 print_success(f"Found {len(models)} models via {version}:")
@@ -87,7 +92,7 @@ def call_gemini_api(api_key, prompt, timeout=30):
         payload = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
         
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=timeout)
+            resp = _session.post(url, json=payload, headers=headers, timeout=timeout)
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get('candidates'):
@@ -107,7 +112,7 @@ def call_openai_api(api_key, prompt, timeout=30):
             "temperature": 0.7
         }
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=timeout)
+            resp = _session.post(url, json=payload, headers=headers, timeout=timeout)
             if resp.status_code == 200:
                 return resp.json()['choices'][0]['message']['content'].strip()
         except: continue
@@ -129,7 +134,7 @@ def call_anthropic_api(api_key, prompt, timeout=30):
             "messages": [{"role": "user", "content": prompt}]
         }
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=timeout)
+            resp = _session.post(url, json=payload, headers=headers, timeout=timeout)
             if resp.status_code == 200:
                 return resp.json()['content'][0]['text'].strip()
         except: continue
@@ -145,7 +150,7 @@ def call_ollama_api(base_url, prompt, timeout=60):
         "stream": False
     }
     try:
-        resp = requests.post(url, json=payload, timeout=timeout)
+        resp = _session.post(url, json=payload, timeout=timeout)
         if resp.status_code == 200:
             return resp.json().get('response', '').strip()
     except: return None
@@ -218,11 +223,10 @@ def compress_history(api_key, history):
     recent_turns = history[-2:]
     history_to_compress = history[:-2]
     
-    history_text = ""
-    for msg in history_to_compress:
-        role = "User" if msg['role'] == 'user' else "Agent"
-        text = msg.get('text', '[Tool Action]')
-        history_text += f"{role}: {text}\n"
+    history_text = "".join(
+        f"{'User' if msg['role'] == 'user' else 'Agent'}: {msg.get('text', '[Tool Action]')}\n"
+        for msg in history_to_compress
+    )
 
     prompt = f"""
 You are a Technical System Distiller. Summarize this chat history into a dense XML <state_snapshot>.
@@ -346,12 +350,12 @@ def code_mentor_chat(api_key, query, code_context, history=None):
                 # Some v1 models might not support tools either, or might require different schema
                 # We'll try with tools first, and fallback if it returns 400
                 
-            resp = requests.post(url, json=payload, headers=headers, timeout=15)
+            resp = _session.post(url, json=payload, headers=headers, timeout=15)
             
             if resp.status_code == 400 and version == "v1":
                 # Fallback: Try without tools on v1 if it failed
                 payload.pop("tools", None)
-                resp = requests.post(url, json=payload, headers=headers, timeout=15)
+                resp = _session.post(url, json=payload, headers=headers, timeout=15)
 
             if resp.status_code == 200:
                 data = resp.json()
@@ -1,7 +1,7 @@
 import sys
 import time
-import os
 import random
+from .ui import clear_screen
 
 # ANSI color codes
 CYAN = "\033[96m"
@@ -588,8 +588,7 @@ __________        ________._____________ ____ ___ __________
 
 def show_banner():
     """Displays a random animated banner from the collection."""
-    # Clear screen based on OS
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     
     # Pick a random banner
     banner = random.choice(BANNERS)
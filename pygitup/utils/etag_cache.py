@@ -0,0 +1,60 @@
+import hashlib
+import os
+import shelve
+import threading
+import time
+
+from ..core.config import get_config_dir
+
+# shelve is not safe for concurrent writers, and multi-repo updates run in threads
+_lock = threading.Lock()
+
+# Entries not refreshed by a full response for this long are dropped on the first store of a run
+MAX_AGE = 30 * 24 * 3600
+_pruned = False
+
+def get_cache_path():
+    """Returns the on-disk location of the ETag cache."""
+    return os.path.join(get_config_dir(), "etag_cache")
+
+def _key(url, token):
+    # Scoped to the credential so one account's payload is never replayed for another
+    return hashlib.sha256((token or "").encode()).hexdigest()[:16] + " " + url
+
+def compact(data):
+    """Drops the base64 file body from a contents payload; it is never read back.
+
+    conditional_get returns the compacted payload on fresh and cached responses
+    alike, so callers always see the same shape.
+    """
+    if isinstance(data, dict) and "content" in data:
+        return {k: v for k, v in data.items() if k != "content"}
+    return data
+
+def _prune(db, now):
+    for key in [k for k, entry in db.items() if now - entry.get("last_seen", 0) > MAX_AGE]:
+        del db[key]
+
+def get_cached(url, token):
+    """Return the cached entry ({'etag', 'data', 'last_seen'}) for a URL and token, or None."""
+    try:
+        with _lock, shelve.open(get_cache_path()) as db:
+            return db.get(_key(url, token))
+    except Exception:
+        # A corrupt or locked cache must never break an API call
+        return None
+
+def store(url, token, etag, data):
+    """Remember the ETag and compacted payload returned for a URL and token."""
+    global _pruned
+    if not etag:
+        return
+    now = time.time()
+    try:
+        with _lock, shelve.open(get_cache_path()) as db:
+            if not _pruned:
+                _pruned = True
+                _prune(db, now)
+            db[_key(url, token)] = {"etag": etag, "data": compact(data), "last_seen": now}
+    except Exception:
+        pass
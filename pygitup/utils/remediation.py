@@ -356,18 +356,12 @@ def purge_file_from_history(file_path):
         return False
 
 
+_SED_SPECIAL_RE = re.compile(r"([\\/&$.*\[\]])")
+
 def escape_sed_string(s):
     """Escape special characters for sed replacement."""
-    # Escape special sed characters
-    s = s.replace('\\', '\\\\')
-    s = s.replace('/', '\\/')
-    s = s.replace('&', '\\&')
-    s = s.replace('$', '\\$')
-    s = s.replace('.', '\\.')
-    s = s.replace('*', '\\*')
-    s = s.replace('[', '\\[')
-    s = s.replace(']', '\\]')
-    return s
+    # One pass over the string instead of one per special character
+    return _SED_SPECIAL_RE.sub(r"\\\1", s)
 
 
 def purge_string_from_history(secret_string):
@@ -1,7 +1,7 @@
-import requests
 import re
 from bs4 import BeautifulSoup
 from .ui import print_warning, print_info, print_success
+from ..github.api import get_session
 from datetime import datetime
 
 def extract_social_links(text):
@@ -36,7 +36,7 @@ def scrape_repo_info(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = get_session().get(url, headers=headers, timeout=15)
         if response.status_code != 200:
             print_warning(f"Scrape failed: HTTP {response.status_code}")
             return None
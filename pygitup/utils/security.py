@@ -152,11 +152,8 @@ class SASTVisitor(ast.NodeVisitor):
                                 })
         self.generic_visit(node)
 
-def run_local_sast_scan(directory):
-    """Scans Python code using AST analysis for semantic security flaws."""
-    print_info(f"Initiating AST-based SAST scan in {directory}...")
-    vulnerabilities = []
-    
+def iter_local_sast_scan(directory):
+    """Yields AST findings one at a time, file by file, without printing anything."""
     for root, _, files in os.walk(directory):
         for file in files:
             if file.endswith('.py'):
@@ -164,13 +161,18 @@ def run_local_sast_scan(directory):
                 try:
                     with open(path, 'r', encoding='utf-8') as f:
                         tree = ast.parse(f.read(), filename=path)
-                        visitor = SASTVisitor()
-                        visitor.visit(tree)
-                        for v in visitor.vulnerabilities:
-                            v['file'] = path
-                            vulnerabilities.append(v)
+                    visitor = SASTVisitor()
+                    visitor.visit(tree)
                 except Exception:
-                    pass # Skip unparsable files
+                    continue # Skip unparsable files
+                for v in visitor.vulnerabilities:
+                    v['file'] = path
+                    yield v
+
+def run_local_sast_scan(directory):
+    """Scans Python code using AST analysis for semantic security flaws."""
+    print_info(f"Initiating AST-based SAST scan in {directory}...")
+    vulnerabilities = list(iter_local_sast_scan(directory))
     
     if vulnerabilities:
         print_error(f"ALERT: {len(vulnerabilities)} potential vulnerabilities found via AST Analysis.")
@@ -302,15 +304,18 @@ def run_advanced_security_scan(username, repo_name, token):
     except Exception as e:
         print_warning(f"Advanced security scan failed: {e}")
 
-def check_is_sensitive(file_path):
-    """Checks if a file path matches any sensitive patterns."""
-    name = os.path.basename(file_path)
+def load_sensitive_patterns():
+    """Returns the built-in sensitive patterns plus those from the local .gitignore."""
     gitignore_patterns = []
     if os.path.exists(".gitignore"):
         with open(".gitignore", "r") as f:
             gitignore_patterns = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return SENSITIVE_PATTERNS + gitignore_patterns
 
-    all_patterns = SENSITIVE_PATTERNS + gitignore_patterns
+def check_is_sensitive(file_path, patterns=None):
+    """Checks if a file path matches any sensitive patterns."""
+    name = os.path.basename(file_path)
+    all_patterns = patterns if patterns is not None else load_sensitive_patterns()
     for pattern in all_patterns:
         if fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(file_path, pattern):
             return True
@@ -318,7 +323,8 @@ def check_is_sensitive(file_path):
 
 def audit_files_and_prompt(files):
     """Scans a list of files for sensitive content. Returns None on abort."""
-    sensitive_matches = [f for f in files if check_is_sensitive(f)]
+    patterns = load_sensitive_patterns()
+    sensitive_matches = [f for f in files if check_is_sensitive(f, patterns)]
     if not sensitive_matches:
         return files
 
@@ -334,13 +340,29 @@ def audit_files_and_prompt(files):
         return files
     return None # Return None to signify total abort
 
-def scan_directory_for_sensitive_files(directory):
+def _find_sensitive_paths(directory):
+    """
+    Walks the tree with os.scandir against a single load of the sensitive patterns.
+    Sensitive directories are reported once and not descended into.
+    """
+    patterns = load_sensitive_patterns()
     detected = []
-    for root, dirs, files in os.walk(directory):
-        for name in dirs + files:
-            full_path = os.path.join(root, name)
-            if check_is_sensitive(full_path):
-                detected.append(full_path)
+    stack = [directory]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if check_is_sensitive(entry.path, patterns):
+                    detected.append(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return detected
+
+def scan_directory_for_sensitive_files(directory):
+    detected = _find_sensitive_paths(directory)
 
     if not detected:
         return True
@@ -22,7 +22,7 @@ import subprocess
 import logging
 import math
 from datetime import datetime, timezone, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
 from enum import Enum
@@ -676,11 +676,11 @@ def run_enhanced_sast_scan(directory: str, max_files: int = 100) -> List[Securit
     
     # Collect files first for progress bar
     files_to_scan = []
-    for root, _, files in os.walk(directory):
-        skip_dirs = ['.git', '__pycache__', 'node_modules', 'venv', '.venv', 'build', 'dist', '.eggs']
-        root_lower = root.lower()
-        if any(skip_dir in root_lower for skip_dir in skip_dirs):
-            continue
+    skip_dirs = frozenset({'.git', '__pycache__', 'node_modules', 'venv', '.venv', 'build', 'dist', '.eggs'})
+    for root, dirs, files in os.walk(directory):
+        # Prune whole directory names before descending; substring checks on root
+        # wrongly skipped folders such as "rebuild/" or "distributed/"
+        dirs[:] = [d for d in dirs if d.lower() not in skip_dirs]
         for file in files:
             if any(file.endswith(ext) for ext in target_extensions):
                 files_to_scan.append(os.path.join(root, file))
@@ -838,7 +838,8 @@ class SecurityAuditLogger:
         events = []
         try:
             with open(self.log_file, 'r') as f:
-                for line in f.readlines()[-limit:]:
+                # Only the tail is kept in memory, however large the log has grown
+                for line in deque(f, maxlen=limit):
                     try:
                         events.append(json.loads(line.strip()))
                     except json.JSONDecodeError:
@@ -1,4 +1,6 @@
 
+import os
+import sys
 from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
@@ -9,6 +11,36 @@ from contextlib import contextmanager
 
 console = Console()
 
+# ESC[2J clears the screen, ESC[3J the scrollback, ESC[H homes the cursor
+_ANSI_CLEAR = "\x1b[2J\x1b[3J\x1b[H"
+_vt_enabled = None
+
+def _enable_windows_vt():
+    """Turns on VT escape processing for the Windows console; True if it is available."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+def clear_screen():
+    """Clears the terminal with an escape sequence instead of spawning cls/clear."""
+    global _vt_enabled
+    if os.name == 'nt':
+        if _vt_enabled is None:
+            _vt_enabled = _enable_windows_vt()
+        if not _vt_enabled:
+            os.system('cls')
+            return
+    sys.stdout.write(_ANSI_CLEAR)
+    sys.stdout.flush()
+
 def print_success(message):
     """Prints a success message in green."""
     console.print(f"[bold green]✔ {message}[/bold green]")
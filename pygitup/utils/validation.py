@@ -1,6 +1,7 @@
 
 import re
 import os
+import functools
 import urllib.parse
 
 def validate_repo_name(name):
@@ -84,9 +85,19 @@ def validate_git_url(url):
 
 def get_current_repo_context():
     """Extracts owner and repo name from local git remotes."""
+    cwd = os.getcwd()
+    try:
+        config_mtime = os.stat(os.path.join(cwd, ".git", "config")).st_mtime_ns
+    except OSError:
+        # Not at a repository root (or a worktree); resolve through git every time
+        return _read_repo_context(cwd)
+    # Remotes live in .git/config, so its mtime tells us when the answer can change
+    return _cached_repo_context(cwd, config_mtime)
+
+def _read_repo_context(cwd):
     try:
         import subprocess
-        result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, text=True)
+        result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, text=True, cwd=cwd)
         if result.returncode == 0:
             url = result.stdout.strip()
             # Handle both HTTPS and SSH formats
@@ -99,6 +110,10 @@ def get_current_repo_context():
         pass
     return None, None
 
+@functools.lru_cache(maxsize=8)
+def _cached_repo_context(cwd, config_mtime):
+    return _read_repo_context(cwd)
+
 def sanitize_input(text):
     """Removes potentially dangerous characters from general text input."""
     if not text:
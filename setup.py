@@ -5,6 +5,7 @@ setup(
     version='2.4.6',
     packages=find_packages(),
     include_package_data=True,
+    package_data={'pygitup.ui': ['*.tcss']},
     install_requires=[
         'requests',
         'PyYAML',
@@ -16,6 +17,10 @@ setup(
         'beautifulsoup4',
         'pytest' # For development/testing purposes
     ],
+    extras_require={
+        'fast': ['pybase64', 'orjson'],  # SIMD base64 for uploads, faster JSON decoding
+        'build': ['nuitka'],  # Standalone binary builds (see README)
+    },
     entry_points={
         'console_scripts': [
             'pygitup=pygitup.main:main',
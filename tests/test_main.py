@@ -4,6 +4,8 @@ import sys
 import os
 import yaml
 import base64
+import tempfile
+import time
 from unittest.mock import patch, Mock
 
 # Add the project root to the path so we can import pygitup
@@ -12,7 +14,7 @@ sys.path.insert(0, project_root)
 
 from pygitup.core.args import create_parser
 from pygitup.core.config import load_config, DEFAULT_CONFIG, get_github_token, get_github_username
-from pygitup.github.api import get_repo_info, create_repo, update_file
+from pygitup.github.api import get_repo_info, create_repo, update_file, blob_oid, get_github_headers, get_session, RateLimitedHTTPAdapter
 from pygitup.github.releases import generate_changelog
 
 class TestPygitup(unittest.TestCase):
@@ -55,6 +57,23 @@ class TestPygitup(unittest.TestCase):
         # Clean up the dummy config file
         os.remove("test_config.yaml")
 
+    @patch('pygitup.core.config.validate_config_path', return_value=True)
+    def test_load_config_is_cached_until_the_file_changes(self, mock_validate):
+        with open("test_config.yaml", "w") as f:
+            yaml.dump({"github": {"username": "first"}}, f)
+        try:
+            config = load_config("test_config.yaml")
+            config["github"]["username"] = "mutated"
+            with patch('pygitup.core.config.yaml.safe_load') as mock_load:
+                self.assertEqual(load_config("test_config.yaml")["github"]["username"], "first")
+                mock_load.assert_not_called()
+
+            with open("test_config.yaml", "w") as f:
+                yaml.dump({"github": {"username": "second-user"}}, f)
+            self.assertEqual(load_config("test_config.yaml")["github"]["username"], "second-user")
+        finally:
+            os.remove("test_config.yaml")
+
     def test_get_github_token_from_config(self):
         config = {
             "github": {
@@ -88,34 +107,42 @@ class TestPygitup(unittest.TestCase):
         username = get_github_username(config)
         self.assertEqual(username, "testuser_from_config")
 
-    @patch('pygitup.github.api.requests.request')
-    def test_get_repo_info(self, mock_request):
-        # Set up the mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"name": "test-repo", "description": "A test repo"}
-        mock_request.return_value = mock_response
+    @patch('pygitup.utils.etag_cache.get_cache_path')
+    @patch('pygitup.github.api._session.request')
+    def test_get_repo_info(self, mock_request, mock_cache_path):
+        # Keep the ETag cache out of the real config directory
+        with tempfile.TemporaryDirectory() as cache_dir:
+            mock_cache_path.return_value = os.path.join(cache_dir, "etag_cache")
 
-        # Call the function
-        response = get_repo_info("testuser", "test-repo", "test_token")
+            # Set up the mock response
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.headers = {}
+            mock_response.content = b'{"name": "test-repo", "description": "A test repo"}'
+            mock_request.return_value = mock_response
 
-        # Assert that requests.request was called correctly (with timeout=15)
+            # Call the function
+            response = get_repo_info("testuser", "test-repo", "test_token")
+
+        # Assert that requests.request was called correctly (with timeout=30)
         mock_request.assert_called_once_with(
             "GET",
             "https://api.github.com/repos/testuser/test-repo",
-            headers={"Authorization": "token test_token", "Accept": "application/vnd.github.v3+json"},
-            timeout=15
+            headers=get_github_headers("test_token"),
+            timeout=30
         )
 
-        # Assert that the function returns the mock response
-        self.assertEqual(response, mock_response)
+        # The parsed body comes back wrapped, so callers do not decode it again
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"name": "test-repo", "description": "A test repo"})
 
-    @patch('pygitup.github.api.requests.request')
+    @patch('pygitup.github.api._session.request')
     def test_create_repo(self, mock_request):
         # Set up the mock response
         mock_response = Mock()
         mock_response.status_code = 201
         mock_response.json.return_value = {"name": "test-repo", "html_url": "https://github.com/testuser/test-repo"}
+        mock_response.headers = {}
         mock_request.return_value = mock_response
 
         # Call the function
@@ -125,20 +152,21 @@ class TestPygitup(unittest.TestCase):
         mock_request.assert_called_once_with(
             "POST",
             "https://api.github.com/user/repos",
-            headers={"Authorization": "token test_token", "Accept": "application/vnd.github.v3+json"},
-            timeout=15,
+            headers=get_github_headers("test_token"),
+            timeout=30,
             json={"name": "test-repo", "description": "A test repo", "private": True}
         )
 
         # Assert that the function returns the mock response
         self.assertEqual(response, mock_response)
 
-    @patch('pygitup.github.api.requests.request')
+    @patch('pygitup.github.api._session.request')
     def test_update_file(self, mock_request):
         # Set up the mock response
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"commit": {"sha": "12345"}}
+        mock_response.headers = {}
         mock_request.return_value = mock_response
 
         # Call the function
@@ -150,14 +178,76 @@ class TestPygitup(unittest.TestCase):
         mock_request.assert_called_once_with(
             "PUT",
             "https://api.github.com/repos/testuser/test-repo/contents/hello.txt",
-            headers={"Authorization": "token test_token", "Accept": "application/vnd.github.v3+json"},
-            timeout=15,
+            headers=get_github_headers("test_token"),
+            timeout=30,
             json={"message": "Update hello.txt", "content": encoded_content, "sha": "abcde"}
         )
 
         # Assert that the function returns the mock response
         self.assertEqual(response, mock_response)
 
+    def test_etag_cache_is_per_token_and_prunes_stale_entries(self):
+        from pygitup.utils import etag_cache
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch.object(etag_cache, "get_cache_path", return_value=os.path.join(cache_dir, "etag_cache")), \
+                patch.object(etag_cache, "_pruned", False):
+            etag_cache.store("file", "tok", '"a"', {"sha": "abc", "path": "x.py", "content": "aGVsbG8="})
+            repo = {"name": "demo", "clone_url": "c", "owner": {"login": "octocat", "id": 1}, "parent": {"name": "up"}}
+            etag_cache.store("repo", "tok", '"b"', repo)
+            self.assertEqual(etag_cache.get_cached("file", "tok")["data"], {"sha": "abc", "path": "x.py"})
+            self.assertEqual(etag_cache.get_cached("repo", "tok")["data"], repo)
+            self.assertIsNone(etag_cache.get_cached("repo", "other-tok"))
+
+            with patch.object(etag_cache.time, "time", return_value=time.time() + etag_cache.MAX_AGE + 1), \
+                    patch.object(etag_cache, "_pruned", False):
+                etag_cache.store("fresh", "tok", '"c"', {"sha": "def"})
+            self.assertIsNone(etag_cache.get_cached("file", "tok"))
+            self.assertIsNotNone(etag_cache.get_cached("fresh", "tok"))
+
+    @patch('pygitup.utils.etag_cache.get_cache_path')
+    @patch('pygitup.github.api._session.request')
+    def test_conditional_get_replays_the_same_shape_on_304(self, mock_request, mock_cache_path):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            mock_cache_path.return_value = os.path.join(cache_dir, "etag_cache")
+            body = b'{"name": "test-repo", "clone_url": "https://github.com/testuser/test-repo.git"}'
+            fresh = Mock(status_code=200, headers={"ETag": '"v1"'}, content=body)
+            not_modified = Mock(status_code=304, headers={})
+            mock_request.side_effect = [fresh, not_modified]
+
+            first = get_repo_info("testuser", "test-repo", "test_token")
+            second = get_repo_info("testuser", "test-repo", "test_token")
+
+        self.assertEqual(mock_request.call_args[1]["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+
+    def test_blob_oid_matches_git(self):
+        # Same values `git hash-object` prints for these contents
+        self.assertEqual(blob_oid(b""), "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391")
+        self.assertEqual(blob_oid(b"hello\n"), "ce013625030ba8dba906f756967f9e9ca394464a")
+
+    @patch('pygitup.github.api.time.sleep')
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_rate_limited_adapter_retries_after_429(self, mock_send, mock_sleep):
+        throttled = Mock(status_code=429, headers={"Retry-After": "3"})
+        ok = Mock(status_code=200, headers={})
+        mock_send.side_effect = [throttled, ok]
+
+        request = Mock(headers={"Authorization": "token test_token"})
+        with patch('pygitup.utils.ui.print_info'):
+            response = RateLimitedHTTPAdapter().send(request)
+
+        self.assertIs(response, ok)
+        self.assertEqual(mock_send.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 3, delta=1)
+
+    def test_rate_limited_adapter_only_covers_the_api(self):
+        session = get_session()
+        self.assertIsInstance(session.get_adapter("https://api.github.com/user"), RateLimitedHTTPAdapter)
+        self.assertNotIsInstance(session.get_adapter("https://github.com/octocat/hello"), RateLimitedHTTPAdapter)
+        self.assertNotIsInstance(session.get_adapter("https://www.google.com"), RateLimitedHTTPAdapter)
+
     @patch('pygitup.github.releases.get_commit_history')
     def test_generate_changelog(self, mock_get_commit_history):
         # Set up the mock response
@@ -186,5 +276,28 @@ class TestPygitup(unittest.TestCase):
         expected_changelog = "## Changelog for v1.0.0\n\n- feat: Add new feature (Test User on 2025-09-27)\n- fix: Fix a bug (Test User on 2025-09-26)\n"
         self.assertEqual(changelog, expected_changelog)
 
+    @patch('subprocess.run')
+    def test_repo_context_is_cached_until_git_config_changes(self, mock_run):
+        from pygitup.utils import validation
+        mock_run.return_value = Mock(returncode=0, stdout="git@github.com:octocat/hello.git\n")
+        original_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as repo_dir:
+            os.mkdir(os.path.join(repo_dir, ".git"))
+            git_config = os.path.join(repo_dir, ".git", "config")
+            open(git_config, "w").close()
+            os.chdir(repo_dir)
+            validation._cached_repo_context.cache_clear()
+            try:
+                self.assertEqual(validation.get_current_repo_context(), ("octocat", "hello"))
+                self.assertEqual(validation.get_current_repo_context(), ("octocat", "hello"))
+                self.assertEqual(mock_run.call_count, 1)
+
+                os.utime(git_config, ns=(0, 0))
+                validation.get_current_repo_context()
+                self.assertEqual(mock_run.call_count, 2)
+            finally:
+                os.chdir(original_cwd)
+                validation._cached_repo_context.cache_clear()
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
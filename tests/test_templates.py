@@ -0,0 +1,85 @@
+import pytest
+from pygitup.project.templates import PROJECT_TEMPLATES, _compiled_template, _compile_template_body, _render_bytes
+
+VARIABLES = {"PROJECT_NAME": "demo", "DESCRIPTION": "A demo project", "AUTHOR": "octocat"}
+
+def naive_render(body, variables):
+    for k, v in variables.items():
+        body = body.replace(f"{{{{{k}}}}}", v)
+    return body.encode('utf-8')
+
+@pytest.mark.parametrize("name", list(PROJECT_TEMPLATES))
+def test_compiled_templates_render_like_str_replace(name):
+    for path, body in PROJECT_TEMPLATES[name]["files"].items():
+        assert _render_bytes(_compiled_template(name)[path], VARIABLES) == naive_render(body, VARIABLES)
+
+def test_compiled_templates_are_cached():
+    assert _compiled_template("cli-python") is _compiled_template("cli-python")
+
+def test_unknown_placeholders_are_left_untouched():
+    body = _compiled_template("fastapi-pro")["README.md"]
+    rendered = _render_bytes(body, {"PROJECT_NAME": "demo"})
+    assert b"# demo" in rendered
+    assert b"{{DESCRIPTION}}" in rendered
+
+def test_missing_author_renders_empty():
+    body = _compile_template_body("by {{AUTHOR}}")
+    assert _render_bytes(body, {"AUTHOR": None}) == b"by "
+
+def test_literal_percent_signs_survive_rendering():
+    body = _compile_template_body("100% {{PROJECT_NAME}} %(x)s")
+    assert _render_bytes(body, VARIABLES) == b"100% demo %(x)s"
+
+def test_commit_files_atomically_makes_a_single_commit(monkeypatch):
+    from unittest.mock import Mock
+    from pygitup.github import api
+    calls = []
+    def fake_request(method, url, token, session=None, json=None, **kwargs):
+        calls.append((method, url.rsplit("/git/", 1)[-1]))
+        if url.endswith("/ref/heads/main"):
+            return Mock(status_code=200, json=lambda: {"object": {"sha": "parent"}})
+        if "/commits/" in url:
+            return Mock(status_code=200, json=lambda: {"tree": {"sha": "base"}})
+        return Mock(status_code=201 if method == "POST" else 200, json=lambda: {"sha": "new"})
+    monkeypatch.setattr(api, "github_request", fake_request)
+    resp = api.commit_files_atomically("octocat", "demo", "tok", {"a.txt": b"a", "b.txt": b"b"}, "init")
+    assert resp.status_code == 200
+    assert [c for c in calls if c[1] == "blobs"] == [("POST", "blobs")] * 2
+    assert calls[-3:] == [("POST", "trees"), ("POST", "commits"), ("PATCH", "refs/heads/main")]
+
+def test_commit_files_atomically_with_no_files_is_a_no_op(monkeypatch):
+    from pygitup.github import api
+    monkeypatch.setattr(api, "github_request", lambda *a, **k: pytest.fail("no request expected"))
+    assert api.commit_files_atomically("octocat", "demo", "tok", {}, "init").status_code == 200
+
+def test_deploy_reports_each_phase_once_on_the_default_branch(monkeypatch):
+    from unittest.mock import Mock
+    from pygitup.project import templates
+    monkeypatch.setattr(templates, "create_repo", lambda *a, **k: Mock(status_code=201, json=lambda: {"default_branch": "trunk"}))
+    monkeypatch.setattr(templates.shutil, "which", lambda name: None)
+    branches = []
+    def fake_commit(rendered, user, repo, token, branch, session=None):
+        branches.append(branch)
+        return list(rendered)
+    monkeypatch.setattr(templates, "_commit_template_via_git_data_api", fake_commit)
+    statuses = []
+    ok, _ = templates.core_deploy_template("cli-python", "demo", "d", False, "octocat", "tok",
+                                           {"github": {"username": "octocat"}}, lambda step, status: statuses.append(status))
+    assert ok
+    assert tuple(statuses) == templates.DEPLOY_PHASES
+    assert branches == ["trunk"]
+
+def test_git_push_fills_in_a_missing_user_name(monkeypatch):
+    from unittest.mock import Mock
+    from pygitup.project import templates
+    commits = []
+    def fake_run(cmd, **kwargs):
+        if cmd[3:] == ["config", "user.name"]:
+            return Mock(returncode=1)
+        if "commit" in cmd:
+            commits.append(cmd)
+        return Mock(returncode=0)
+    monkeypatch.setattr(templates.subprocess, "run", fake_run)
+    templates._push_template_via_git({"a.txt": b"a"}, "octocat", "demo", "tok")
+    assert "user.name=octocat" in commits[0]
+    assert not any(arg.startswith("user.email=") for arg in commits[0])
@@ -0,0 +1,121 @@
+import ast
+import collections
+import os
+from unittest.mock import Mock
+
+from pygitup.ui import app
+
+def test_dashboard_module_defines_each_top_level_name_once():
+    with open(app.__file__, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    names = [node.name for node in tree.body if isinstance(node, (ast.ClassDef, ast.FunctionDef))]
+    duplicates = [name for name, count in collections.Counter(names).items() if count > 1]
+    assert duplicates == []
+
+def test_cached_reuses_results_and_skips_errors():
+    app._CACHE.clear()
+    ok = Mock(return_value=Mock(status_code=200))
+    assert app._cached(("info", "o", "r"), 60, ok) is app._cached(("info", "o", "r"), 60, ok)
+    assert ok.call_count == 1
+
+    failing = Mock(return_value=Mock(status_code=502))
+    app._cached(("info", "o", "x"), 60, failing)
+    app._cached(("info", "o", "x"), 60, failing)
+    assert failing.call_count == 2
+    app._CACHE.clear()
+
+def test_stylesheet_ships_next_to_the_app():
+    assert os.path.isfile(os.path.join(os.path.dirname(app.__file__), app.PyGitUpTUI.CSS_PATH))
+
+def test_context_scan_prunes_excluded_dirs_and_stops_at_limit(tmp_path):
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("")
+    (tmp_path / "src").mkdir()
+    for i in range(5):
+        (tmp_path / "src" / f"m{i}.py").write_text("")
+    (tmp_path / "setup.py").write_text("")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG")
+    files = app._scan_context_files(str(tmp_path), limit=10)
+    assert files[0] == "setup.py"
+    assert "logo.png" not in files
+    assert not any(f.startswith("node_modules") for f in files)
+    assert len(app._scan_context_files(str(tmp_path), limit=2)) == 2
+
+def test_context_stamp_changes_when_git_head_moves(tmp_path):
+    (tmp_path / ".git").mkdir()
+    head = tmp_path / ".git" / "HEAD"
+    head.write_text("ref: refs/heads/main\n")
+    before = app._context_stamp(str(tmp_path))
+    assert app._context_stamp(str(tmp_path)) == before
+    os.utime(head, ns=(0, 0))
+    assert app._context_stamp(str(tmp_path)) != before
+
+def test_cached_replaces_entries_when_the_stamp_changes():
+    app._CACHE.clear()
+    calls = []
+    fetch = lambda: calls.append(1) or len(calls)
+    assert app._cached(("context", "/w"), 60, fetch, stamp=(1,)) == 1
+    assert app._cached(("context", "/w"), 60, fetch, stamp=(1,)) == 1
+    assert app._cached(("context", "/w"), 60, fetch, stamp=(2,)) == 2
+    assert len(app._CACHE) == 1
+    app._CACHE.clear()
+
+def test_button_tables_point_at_existing_methods():
+    for table in (app.PyGitUpTUI._BUTTON_TASKS, app.PyGitUpTUI._BUTTON_HANDLERS, app.PyGitUpTUI._VIEW_DISPATCH):
+        for method in table.values():
+            assert callable(getattr(app.PyGitUpTUI, method, None)), method
+
+def test_truncate_lines_caps_long_diffs():
+    short = "a\nb"
+    assert app._truncate_lines(short, limit=2) is short
+    assert app._truncate_lines("1\n2\n3\n4", limit=2) == "1\n2\n... (2 more lines truncated)"
+
+def test_cached_coalesces_concurrent_identical_lookups():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    app._CACHE.clear()
+    started = threading.Event()
+    calls = []
+    def slow_fetch():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return Mock(status_code=200)
+    with ThreadPoolExecutor(2) as pool:
+        first = pool.submit(app._cached, ("info", "o", "slow"), 60, slow_fetch)
+        started.wait()
+        second = pool.submit(app._cached, ("info", "o", "slow"), 60, slow_fetch)
+        assert first.result() is second.result()
+    assert len(calls) == 1
+    app._CACHE.clear()
+
+def test_context_scan_stops_at_max_depth(tmp_path):
+    deep = tmp_path / "a" / "b" / "c"
+    deep.mkdir(parents=True)
+    (tmp_path / "a" / "top.py").write_text("")
+    (deep / "leaf.py").write_text("")
+    assert app._scan_context_files(str(tmp_path), max_depth=1) == [os.path.join("a", "top.py")]
+    assert os.path.join("a", "b", "c", "leaf.py") in app._scan_context_files(str(tmp_path), max_depth=3)
+
+def test_prewarm_covers_every_handler_import():
+    with open(app.__file__, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    lazy = {
+        "pygitup." + node.module
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom) and node.level == 2 and node.col_offset > 0
+    }
+    assert lazy - {"pygitup.core.config", "pygitup.github.api"} <= set(app.PREWARM_MODULES)
+
+def test_chat_state_is_per_instance():
+    first, second = app.PyGitUpTUI(), app.PyGitUpTUI()
+    first.chat_history.append({"role": "user", "text": "hi"})
+    assert second.chat_history == []
+    assert first.user_signal is not second.user_signal
+
+def test_staged_diff_is_empty_without_git(monkeypatch):
+    def missing_git(*args, **kwargs):
+        raise FileNotFoundError("git")
+    monkeypatch.setattr(app.subprocess, "run", missing_git)
+    assert app._staged_diff() == ""